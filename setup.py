@@ -1,7 +1,24 @@
 """Setup configuration for AI Integrator."""
 
+import os
+
 from setuptools import setup, find_packages
 
+# Opt-in AOT compilation of hot pure-Python modules with mypyc. The .py
+# sources always ship, so installs without a compiler keep working.
+#     AI_INTEGRATOR_USE_MYPYC=1 pip install .
+USE_MYPYC = os.getenv("AI_INTEGRATOR_USE_MYPYC") == "1"
+MYPYC_MODULES = ["src/ai_integrator/core/provenance.py"]
+
+if USE_MYPYC:
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        ["--ignore-missing-imports", "--follow-imports=silent", *MYPYC_MODULES]
+    )
+else:
+    ext_modules = []
+
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
@@ -15,6 +32,7 @@ setup(
     url="https://github.com/HanzoRazer/ai-integrator",
     package_dir={"": "src"},
     packages=find_packages(where="src"),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -39,7 +57,7 @@ setup(
     extras_require={
         "dev": [
             "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=0.24.0",
             "pytest-cov>=4.0.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
@@ -49,6 +67,7 @@ setup(
         "openai": ["openai>=1.0.0"],
         "anthropic": ["anthropic>=0.3.0"],
         "google": ["google-generativeai>=0.3.0"],
+        "msgpack": ["msgpack>=1.0.0"],
         "all": [
             "openai>=1.0.0",
             "anthropic>=0.3.0",
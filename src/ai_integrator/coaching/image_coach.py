@@ -19,10 +19,12 @@ Usage:
     request = coach.create_image_request(context)
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+import sys
+from dataclasses import dataclass, replace
+from typing import Optional, Dict, Any, List, Tuple
 from enum import Enum
 
+from ai_integrator.core._compat import DATACLASS_SLOTS
 from ai_integrator.core.image_types import (
     ImageRequest,
     ImageSize,
@@ -76,13 +78,16 @@ class StyleEra(Enum):
     MINIMALIST = "minimalist"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class DesignContext:
     """Context for guitar design coaching.
     
     This captures all the design parameters needed to generate
     consistent, high-quality guitar visualizations.
     
+    Contexts are immutable; use `dataclasses.replace()` to derive
+    a modified copy.
+    
     Attributes:
         guitar_type: Type of guitar (classical, dreadnought, etc.)
         component: Which part to visualize
@@ -108,7 +113,13 @@ class DesignContext:
     finish_type: Optional[FinishType] = None
     style_era: Optional[StyleEra] = None
     custom_details: Optional[str] = None
-    reference_images: List[str] = field(default_factory=list)
+    reference_images: Tuple[str, ...] = ()
+    
+    def __post_init__(self):
+        # Store a tuple even when given a list, so contexts derived with
+        # replace() never share mutable state and stay hashable
+        if not isinstance(self.reference_images, tuple):
+            object.__setattr__(self, "reference_images", tuple(self.reference_images))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -120,7 +131,7 @@ class DesignContext:
             "finish_type": self.finish_type.value if self.finish_type else None,
             "style_era": self.style_era.value if self.style_era else None,
             "custom_details": self.custom_details,
-            "reference_images": self.reference_images,
+            "reference_images": list(self.reference_images),
         }
 
 
@@ -225,6 +236,15 @@ class ImageCoach:
         StyleEra.MINIMALIST: "Ultra-minimalist design, subtle details, focus on wood natural beauty",
     }
     
+    # Short style words used in templates
+    STYLE_WORDS: Dict[Optional[StyleEra], str] = {
+        StyleEra.VINTAGE: "vintage",
+        StyleEra.MODERN: "modern",
+        StyleEra.TRADITIONAL: "traditional",
+        StyleEra.ART_DECO: "art deco",
+        StyleEra.MINIMALIST: "minimalist",
+    }
+    
     # Finish descriptions
     FINISH_DESCRIPTIONS: Dict[FinishType, str] = {
         FinishType.NATURAL: "natural clear finish highlighting the wood's character",
@@ -256,24 +276,40 @@ class ImageCoach:
         self.templates = dict(self.COMPONENT_TEMPLATES)
         if custom_templates:
             self.templates.update(custom_templates)
+        
+        # Resolve a description for every enum member once, so lookups in
+        # the prompt-building path are plain dict reads. Interning lets
+        # repeated prompts share the same string objects.
+        self._wood_descriptions: Dict[WoodType, str] = {
+            wood: sys.intern(self.WOOD_DESCRIPTIONS.get(wood, f"{wood.value} wood"))
+            for wood in WoodType
+        }
+        self._era_descriptions: Dict[StyleEra, str] = {
+            era: sys.intern(self.STYLE_ERA_DESCRIPTIONS.get(era, f"{era.value} style"))
+            for era in StyleEra
+        }
+        self._finish_descriptions: Dict[FinishType, str] = {
+            finish: sys.intern(self.FINISH_DESCRIPTIONS.get(finish, f"{finish.value} finish"))
+            for finish in FinishType
+        }
     
     def get_wood_description(self, wood_type: Optional[WoodType]) -> str:
         """Get natural language description for a wood type."""
         if wood_type is None:
             return "fine tonewoods"
-        return self.WOOD_DESCRIPTIONS.get(wood_type, f"{wood_type.value} wood")
+        return self._wood_descriptions[wood_type]
     
     def get_era_description(self, style_era: Optional[StyleEra]) -> str:
         """Get natural language description for a style era."""
         if style_era is None:
             return "timeless design"
-        return self.STYLE_ERA_DESCRIPTIONS.get(style_era, f"{style_era.value} style")
+        return self._era_descriptions[style_era]
     
     def get_finish_description(self, finish_type: Optional[FinishType]) -> str:
         """Get natural language description for a finish type."""
         if finish_type is None:
             return "natural finish"
-        return self.FINISH_DESCRIPTIONS.get(finish_type, f"{finish_type.value} finish")
+        return self._finish_descriptions[finish_type]
     
     def build_prompt(
         self,
@@ -321,16 +357,7 @@ class ImageCoach:
                 inlay_context = "abalone shell inlays"
         
         # Determine style word
-        style = "elegant"
-        if context.style_era:
-            style_map = {
-                StyleEra.VINTAGE: "vintage",
-                StyleEra.MODERN: "modern",
-                StyleEra.TRADITIONAL: "traditional",
-                StyleEra.ART_DECO: "art deco",
-                StyleEra.MINIMALIST: "minimalist",
-            }
-            style = style_map.get(context.style_era, "elegant")
+        style = self.STYLE_WORDS.get(context.style_era, "elegant")
         
         # Fill template
         prompt = template.format(
@@ -343,15 +370,17 @@ class ImageCoach:
             inlay_context=inlay_context,
         )
         
+        parts = [prompt]
+        
         # Add custom details if provided
         if context.custom_details:
-            prompt = f"{prompt} Additional details: {context.custom_details}"
+            parts.append(f"Additional details: {context.custom_details}")
         
         # Add user additions if provided
         if user_additions:
-            prompt = f"{prompt} {user_additions}"
+            parts.append(user_additions)
         
-        return prompt.strip()
+        return " ".join(parts).strip()
     
     def build_negative_prompt(
         self,
@@ -452,48 +481,22 @@ class ImageCoach:
             count: Number of variations to suggest
         
         Returns:
-            List of DesignContext variations
+            List of DesignContext variations. Each variation copies
+            every field of base_context except the one being varied.
         """
         variations = []
         
         if variation_type == "wood":
             woods = [WoodType.SPRUCE, WoodType.CEDAR, WoodType.MAHOGANY, WoodType.ROSEWOOD]
-            for wood in woods[:count]:
-                ctx = DesignContext(
-                    guitar_type=base_context.guitar_type,
-                    component=base_context.component,
-                    wood_type=wood,
-                    finish_type=base_context.finish_type,
-                    style_era=base_context.style_era,
-                    custom_details=base_context.custom_details,
-                )
-                variations.append(ctx)
+            variations = [replace(base_context, wood_type=wood) for wood in woods[:count]]
         
         elif variation_type == "finish":
             finishes = [FinishType.NATURAL, FinishType.SUNBURST, FinishType.VINTAGE_TINT, FinishType.SATIN]
-            for finish in finishes[:count]:
-                ctx = DesignContext(
-                    guitar_type=base_context.guitar_type,
-                    component=base_context.component,
-                    wood_type=base_context.wood_type,
-                    finish_type=finish,
-                    style_era=base_context.style_era,
-                    custom_details=base_context.custom_details,
-                )
-                variations.append(ctx)
+            variations = [replace(base_context, finish_type=finish) for finish in finishes[:count]]
         
         elif variation_type == "era":
             eras = [StyleEra.VINTAGE, StyleEra.MODERN, StyleEra.TRADITIONAL, StyleEra.MINIMALIST]
-            for era in eras[:count]:
-                ctx = DesignContext(
-                    guitar_type=base_context.guitar_type,
-                    component=base_context.component,
-                    wood_type=base_context.wood_type,
-                    finish_type=base_context.finish_type,
-                    style_era=era,
-                    custom_details=base_context.custom_details,
-                )
-                variations.append(ctx)
+            variations = [replace(base_context, style_era=era) for era in eras[:count]]
         
         return variations
 
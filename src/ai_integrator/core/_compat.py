@@ -0,0 +1,13 @@
+"""Python version compatibility helpers.
+
+ai-integrator supports Python 3.8+, but some dataclass features used on
+hot paths are only available on newer interpreters. These helpers let
+modules opt in where supported without breaking older versions.
+"""
+
+import sys
+from typing import Any, Dict
+
+# `@dataclass(slots=True)` requires Python 3.10+. Splat into the decorator:
+#     @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -14,15 +14,28 @@ Usage:
 """
 
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Optional, Dict, Any, List
 from enum import Enum
 
+from ai_integrator.core._compat import DATACLASS_SLOTS
+
+_get_url = attrgetter("url")
+
 
 class ImageSize(Enum):
     """Standard image dimensions for generation.
     
     Different providers support different sizes. Check provider
     capabilities with `provider.supports_size(size)`.
+    
+    Attributes:
+        width: Width in pixels
+        height: Height in pixels
+        is_square: Whether width equals height
+    
+    Dimensions are parsed once per member at class creation, so reading
+    them is a plain attribute access.
     """
     SMALL = "256x256"
     MEDIUM = "512x512"
@@ -31,20 +44,11 @@ class ImageSize(Enum):
     TALL = "1024x1792"      # Portrait
     SQUARE_HD = "1024x1024"  # High-def square (DALL-E 3)
     
-    @property
-    def width(self) -> int:
-        """Get width in pixels."""
-        return int(self.value.split("x")[0])
-    
-    @property
-    def height(self) -> int:
-        """Get height in pixels."""
-        return int(self.value.split("x")[1])
-    
-    @property
-    def is_square(self) -> bool:
-        """Check if dimensions are square."""
-        return self.width == self.height
+    def __init__(self, value: str):
+        width, height = value.split("x")
+        self.width: int = int(width)
+        self.height: int = int(height)
+        self.is_square: bool = self.width == self.height
 
 
 class ImageStyle(Enum):
@@ -68,7 +72,7 @@ class ImageFormat(Enum):
     B64_JSON = "b64_json"  # Base64-encoded response
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ImageRequest:
     """Request for image generation.
     
@@ -111,11 +115,14 @@ class ImageRequest:
     
     def __post_init__(self):
         """Validate request parameters."""
-        if not self.prompt or not self.prompt.strip():
+        # Only strip() when the prompt starts with whitespace; a prompt
+        # with a non-space first character can't be blank
+        prompt = self.prompt
+        if not prompt or (prompt[0].isspace() and not prompt.strip()):
             raise ValueError("prompt cannot be empty")
-        if self.num_images < 1:
-            raise ValueError("num_images must be at least 1")
-        if self.num_images > 10:
+        if not 1 <= self.num_images <= 10:
+            if self.num_images < 1:
+                raise ValueError("num_images must be at least 1")
             raise ValueError("num_images cannot exceed 10")
     
     def to_dict(self) -> Dict[str, Any]:
@@ -135,7 +142,7 @@ class ImageRequest:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GeneratedImage:
     """A single generated image with metadata.
     
@@ -153,15 +160,15 @@ class GeneratedImage:
     @property
     def has_data(self) -> bool:
         """Check if raw image data is available."""
-        return self.data is not None and len(self.data) > 0
+        return bool(self.data)
     
     @property
     def has_url(self) -> bool:
         """Check if image URL is available."""
-        return self.url is not None and len(self.url) > 0
+        return bool(self.url)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ImageResponse:
     """Response from image generation.
     
@@ -202,7 +209,8 @@ class ImageResponse:
     @property
     def image_urls(self) -> List[str]:
         """Get all image URLs (convenience property)."""
-        return [img.url for img in self.images if img.has_url]
+        # filter(None, ...) drops the same None/"" urls that has_url rejects
+        return list(filter(None, map(_get_url, self.images)))
     
     @property
     def provenance(self) -> Optional[Dict[str, Any]]:
@@ -36,6 +36,8 @@ class AIIntegrator:
         # Text providers
         self.providers: Dict[str, BaseProvider] = {}
         self._default_provider: Optional[str] = None
+        # Model identifier -> name of the first registered provider serving it
+        self._model_index: Dict[str, str] = {}
         
         # Image providers
         self.image_providers: Dict[str, BaseImageProvider] = {}
@@ -53,7 +55,13 @@ class AIIntegrator:
             >>> integrator = AIIntegrator()
             >>> integrator.add_provider('openai', OpenAIProvider(api_key='key'))
         """
+        replacing = name in self.providers
         self.providers[name] = provider
+        if replacing:
+            self._rebuild_model_index()
+        else:
+            for model in provider.get_available_models():
+                self._model_index.setdefault(model, name)
         if self._default_provider is None:
             self._default_provider = name
 
@@ -66,8 +74,29 @@ class AIIntegrator:
         """
         if name in self.providers:
             del self.providers[name]
+            self._rebuild_model_index()
             if self._default_provider == name:
-                self._default_provider = next(iter(self.providers.keys()), None)
+                # Dicts keep insertion order: fall back to the oldest remaining provider
+                self._default_provider = next(iter(self.providers), None)
+
+    def _rebuild_model_index(self) -> None:
+        """Rebuild the model -> provider name index from registered providers."""
+        self._model_index = {}
+        for name, provider in self.providers.items():
+            for model in provider.get_available_models():
+                self._model_index.setdefault(model, name)
+
+    def _resolve_provider_name(self, model: str) -> Optional[str]:
+        """
+        Pick a provider for a model when none is named explicitly.
+
+        Prefers the default provider; otherwise falls back to the first
+        registered provider that serves the model.
+        """
+        default = self._default_provider
+        if default is not None and self.providers[default].validate_model(model):
+            return default
+        return self._model_index.get(model, default)
 
     def set_default_provider(self, name: str) -> None:
         """
@@ -121,7 +150,9 @@ class AIIntegrator:
         Args:
             prompt: The input prompt
             model: Model identifier
-            provider: Provider name (uses default if None)
+            provider: Provider name. If None, uses the default provider, or
+                      the first registered provider serving `model` when the
+                      default does not.
             temperature: Sampling temperature (0.0 to 1.0)
             max_tokens: Maximum tokens to generate
             system_prompt: System prompt for chat models
@@ -138,7 +169,8 @@ class AIIntegrator:
             ... )
             >>> print(response.text)
         """
-        provider_instance = self.get_provider(provider)
+        provider_name = provider or self._resolve_provider_name(model)
+        provider_instance = self.get_provider(provider_name)
 
         request = AIRequest(
             prompt=prompt,
@@ -151,8 +183,7 @@ class AIIntegrator:
 
         if not provider_instance.validate_model(model):
             raise ModelNotFoundError(
-                f"Model '{model}' not available from provider "
-                f"'{provider or self._default_provider}'"
+                f"Model '{model}' not available from provider '{provider_name}'"
             )
 
         return await provider_instance.generate(request)
@@ -174,17 +205,23 @@ class AIIntegrator:
 
     async def generate_parallel(
         self, prompt: str, providers_config: Dict[str, Dict[str, Any]]
-    ) -> Dict[str, AIResponse]:
+    ) -> Dict[str, Union[AIResponse, Exception]]:
         """
         Generate responses from multiple providers in parallel.
 
+        All providers are awaited concurrently, so total latency is bounded
+        by the slowest provider rather than the sum of all of them.
+
         Args:
             prompt: The input prompt
             providers_config: Dict mapping provider names to their config
                              Example: {"openai": {"model": "gpt-4"}}
 
         Returns:
-            Dictionary mapping provider names to their responses
+            Dictionary mapping provider names to their responses or exceptions
+
+        Raises:
+            ValueError: If a provider config does not specify a model
 
         Example:
             >>> responses = await integrator.generate_parallel(
@@ -195,7 +232,9 @@ class AIIntegrator:
             ...     }
             ... )
         """
-        tasks = {}
+        # Validate every config before creating any coroutine, so a bad entry
+        # doesn't leave earlier coroutines un-awaited
+        calls = []
         for provider_name, config in providers_config.items():
             # Get model without modifying original config
             model = config.get("model")
@@ -204,13 +243,15 @@ class AIIntegrator:
 
             # Create a copy of config without 'model' key
             config_copy = {k: v for k, v in config.items() if k != "model"}
-            tasks[provider_name] = self.generate(
-                prompt=prompt, model=model, provider=provider_name, **config_copy
-            )
+            calls.append((provider_name, model, config_copy))
 
-        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        coros = [
+            self.generate(prompt=prompt, model=model, provider=provider_name, **config_copy)
+            for provider_name, model, config_copy in calls
+        ]
+        results = await asyncio.gather(*coros, return_exceptions=True)
 
-        return {name: result for name, result in zip(tasks.keys(), results)}
+        return dict(zip(providers_config, results))
 
     # =========================================================================
     # Image Provider Methods
@@ -242,9 +283,8 @@ class AIIntegrator:
         if name in self.image_providers:
             del self.image_providers[name]
             if self._default_image_provider == name:
-                self._default_image_provider = next(
-                    iter(self.image_providers.keys()), None
-                )
+                # Dicts keep insertion order: fall back to the oldest remaining provider
+                self._default_image_provider = next(iter(self.image_providers), None)
 
     def set_default_image_provider(self, name: str) -> None:
         """
@@ -379,17 +419,16 @@ class AIIntegrator:
             ...     }
             ... )
         """
-        tasks = {}
-        for provider_name, config in providers_config.items():
-            tasks[provider_name] = self.generate_image(
-                prompt=prompt,
-                provider=provider_name,
-                **config,
-            )
+        # Unknown providers and invalid requests surface as exceptions in
+        # the result dict rather than aborting the other generations
+        coros = [
+            self.generate_image(prompt=prompt, provider=provider_name, **config)
+            for provider_name, config in providers_config.items()
+        ]
 
-        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        results = await asyncio.gather(*coros, return_exceptions=True)
 
-        return {name: result for name, result in zip(tasks.keys(), results)}
+        return dict(zip(providers_config, results))
 
     def list_all_providers(self) -> Dict[str, Any]:
         """
@@ -18,13 +18,34 @@ Usage:
 """
 
 import hashlib
+import json
+import secrets
 import time
-from dataclasses import dataclass, field, asdict
-from typing import Dict, Any, Optional, List
+from dataclasses import dataclass, field, fields
+from typing import Dict, Any, Final, FrozenSet, Optional, List, Tuple
 from datetime import datetime, timezone
 
+from ai_integrator.core._compat import DATACLASS_SLOTS
 
-@dataclass
+# One encoder for every canonical serialization: sorted keys, no whitespace,
+# str() for non-JSON types, UTF-8 text. Building it once skips the per-call
+# encoder construction json.dumps does for non-default arguments.
+_CANONICAL_ENCODER: Final = json.JSONEncoder(
+    sort_keys=True,
+    default=str,
+    separators=(",", ":"),
+    ensure_ascii=False,
+)
+
+# Algorithm behind input_hash/input_sha256, recorded in every envelope
+# created here: BLAKE2b with an 8-byte digest, as 16 hex chars
+HASH_ALGORITHM: Final = "blake2b-64"
+
+# Fields every provenance envelope must carry (see validate_provenance)
+_REQUIRED_FIELDS: Final[Tuple[str, ...]] = ("request_id", "timestamp", "model_id", "provider_name")
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ProvenanceEnvelope:
     """
     Structured provenance for traceable AI operations.
@@ -44,7 +65,8 @@ class ProvenanceEnvelope:
     template_id: Optional[str] = None
     template_version: Optional[str] = None
     input_hash: Optional[str] = None
-    input_sha256: Optional[str] = None  # Full input packet hash for replay
+    input_sha256: Optional[str] = None  # Full input packet hash for replay (name kept for RMOS)
+    hash_algorithm: Optional[str] = None  # Algorithm of the two hashes above, e.g. "blake2b-64"
     
     # Model identity
     model_id: str = ""
@@ -64,23 +86,75 @@ class ProvenanceEnvelope:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        data = {
+            name: value
+            for name in _ENVELOPE_FIELDS
+            if (value := getattr(self, name)) is not None
+        }
+        # Copy the one mutable field so the dict doesn't alias envelope state
+        if self.policies_applied is not None:
+            data["policies_applied"] = list(self.policies_applied)
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ProvenanceEnvelope":
         """Create from dictionary."""
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        return cls(**{k: v for k, v in data.items() if k in _ENVELOPE_FIELD_NAMES})
+    
+    def to_msgpack(self) -> bytes:
+        """Serialize to MessagePack for compact cross-process caching.
+        
+        Requires the optional `msgpack` package. JSON (to_dict) remains
+        the format for external APIs.
+        """
+        packed: bytes = _import_msgpack().packb(self.to_dict(), use_bin_type=True)
+        return packed
+    
+    @classmethod
+    def from_msgpack(cls, buf: bytes) -> "ProvenanceEnvelope":
+        """Create from MessagePack bytes produced by to_msgpack()."""
+        return cls.from_dict(_import_msgpack().unpackb(buf, raw=False))
+
+
+def _import_msgpack() -> Any:
+    """Lazy load msgpack (optional dependency)."""
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError(
+            "msgpack required for ProvenanceEnvelope binary serialization: pip install msgpack"
+        )
+    return msgpack
+
+
+# Field names in declaration order, resolved once for to_dict()
+_ENVELOPE_FIELDS: Final[Tuple[str, ...]] = tuple(f.name for f in fields(ProvenanceEnvelope))
+# Same names as a set, for filtering unknown keys in from_dict()
+_ENVELOPE_FIELD_NAMES: Final[FrozenSet[str]] = frozenset(_ENVELOPE_FIELDS)
 
 
 def generate_request_id() -> str:
-    """Generate a unique request ID."""
-    import uuid
-    return str(uuid.uuid4())
+    """Generate a unique request ID (16 hex chars, 64 random bits)."""
+    return secrets.token_hex(8)
+
+
+def _canonical_bytes(data: Dict[str, Any]) -> bytes:
+    """Serialize to canonical JSON as UTF-8 bytes (see canonical_json)."""
+    return _CANONICAL_ENCODER.encode(data).encode("utf-8")
+
+
+def _hash_bytes(data: bytes) -> str:
+    """Hash raw bytes to 16 hex chars.
+    
+    Uses BLAKE2b with an 8-byte digest: only 64 bits are kept, so there
+    is no point computing a full SHA-256 and truncating it.
+    """
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
 
 
 def hash_content(content: str) -> str:
-    """Generate SHA-256 hash of content."""
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    """Generate a 16-char BLAKE2b hash of content."""
+    return _hash_bytes(content.encode("utf-8"))
 
 
 def hash_dict(data: Dict[str, Any]) -> str:
@@ -90,9 +164,7 @@ def hash_dict(data: Dict[str, Any]) -> str:
     the same logical content always produces the same hash, regardless
     of key order or formatting.
     """
-    import json
-    serialized = json.dumps(data, sort_keys=True, default=str, separators=(',', ':'))
-    return hash_content(serialized)
+    return _hash_bytes(_canonical_bytes(data))
 
 
 def canonical_json(data: Dict[str, Any]) -> str:
@@ -102,12 +174,15 @@ def canonical_json(data: Dict[str, Any]) -> str:
     Guarantees:
     - Sorted keys (deterministic order)
     - No whitespace variance
-    - Stable string representation of non-JSON types
+    - Stable string representation of non-JSON types (str(), including
+      datetimes, enums and dataclasses)
+    - Non-ASCII text emitted as UTF-8, not \\u escapes
+    - Integers of any size; NaN and +/-inf as the NaN/Infinity tokens,
+      so they never collide with null
     
     Use this before hashing to avoid "hash drift" from formatting.
     """
-    import json
-    return json.dumps(data, sort_keys=True, default=str, separators=(',', ':'))
+    return _canonical_bytes(data).decode("utf-8")
 
 
 def hash_input_packet(packet: Dict[str, Any]) -> str:
@@ -130,8 +205,7 @@ def hash_input_packet(packet: Dict[str, Any]) -> str:
         >>> input_hash = hash_input_packet(packet)
         >>> provenance.input_sha256 = input_hash
     """
-    canonical = canonical_json(packet)
-    return hash_content(canonical)
+    return _hash_bytes(_canonical_bytes(packet))
 
 
 def create_provenance(
@@ -175,6 +249,7 @@ def create_provenance(
         template_id=template_id,
         template_version=template_version,
         input_hash=hash_content(input_content) if input_content else None,
+        hash_algorithm=HASH_ALGORITHM,
         model_id=model_id,
         weights_hash=weights_hash,
         provider_name=provider_name,
@@ -193,11 +268,8 @@ def validate_provenance(provenance: Dict[str, Any]) -> List[str]:
     Returns:
         List of missing/invalid field messages (empty if valid)
     """
-    errors = []
-    required = ["request_id", "timestamp", "model_id", "provider_name"]
-    
-    for field in required:
-        if field not in provenance or not provenance[field]:
-            errors.append(f"provenance missing required field: '{field}'")
-    
-    return errors
+    return [
+        f"provenance missing required field: '{name}'"
+        for name in _REQUIRED_FIELDS
+        if not provenance.get(name)
+    ]
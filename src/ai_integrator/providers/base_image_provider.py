@@ -14,7 +14,7 @@ Usage:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Set
+from typing import AbstractSet, FrozenSet, List, Optional
 
 from ai_integrator.core.image_types import (
     ImageRequest,
@@ -25,6 +25,11 @@ from ai_integrator.core.image_types import (
 )
 from ai_integrator.core.base import ProviderError
 
+# Default capabilities, built once instead of on every property access
+ALL_IMAGE_SIZES: FrozenSet[ImageSize] = frozenset(ImageSize)
+ALL_IMAGE_STYLES: FrozenSet[ImageStyle] = frozenset(ImageStyle)
+ALL_IMAGE_FORMATS: FrozenSet[ImageFormat] = frozenset(ImageFormat)
+
 
 class ImageProviderError(ProviderError):
     """Base exception for image provider errors."""
@@ -61,6 +66,10 @@ class BaseImageProvider(ABC):
     - max_images_per_request: Maximum batch size
     - validate_request(): Custom request validation
     
+    validate_request() snapshots the capability properties on first use.
+    Providers whose capabilities change at runtime must call
+    refresh_capabilities() after reconfiguring.
+    
     Example:
         >>> class DallEProvider(BaseImageProvider):
         ...     async def generate_image(self, request):
@@ -94,6 +103,15 @@ class BaseImageProvider(ABC):
         self.api_key = api_key
         self.timeout = timeout
         self.config = kwargs
+        
+        # Capability snapshot for validate_request(), built lazily so
+        # subclass property overrides are in effect when it is taken
+        self._capabilities_cached = False
+        self._cached_sizes: FrozenSet[ImageSize] = frozenset()
+        self._cached_styles: FrozenSet[ImageStyle] = frozenset()
+        self._cached_formats: FrozenSet[ImageFormat] = frozenset()
+        self._cached_models: FrozenSet[str] = frozenset()
+        self._cached_max_images = 0
     
     @abstractmethod
     async def generate_image(self, request: ImageRequest) -> ImageResponse:
@@ -134,31 +152,31 @@ class BaseImageProvider(ABC):
         pass
     
     @property
-    def supported_sizes(self) -> Set[ImageSize]:
+    def supported_sizes(self) -> AbstractSet[ImageSize]:
         """Get supported image sizes.
         
         Override in subclasses to restrict available sizes.
         Default: all sizes.
         """
-        return set(ImageSize)
+        return ALL_IMAGE_SIZES
     
     @property
-    def supported_styles(self) -> Set[ImageStyle]:
+    def supported_styles(self) -> AbstractSet[ImageStyle]:
         """Get supported image styles.
         
         Override in subclasses to restrict available styles.
         Default: all styles.
         """
-        return set(ImageStyle)
+        return ALL_IMAGE_STYLES
     
     @property
-    def supported_formats(self) -> Set[ImageFormat]:
+    def supported_formats(self) -> AbstractSet[ImageFormat]:
         """Get supported output formats.
         
         Override in subclasses to restrict available formats.
         Default: all formats.
         """
-        return set(ImageFormat)
+        return ALL_IMAGE_FORMATS
     
     @property
     def max_images_per_request(self) -> int:
@@ -213,6 +231,20 @@ class BaseImageProvider(ABC):
         """
         return model in self.get_available_models()
     
+    def refresh_capabilities(self) -> None:
+        """Snapshot provider capabilities used by validate_request().
+        
+        Called automatically on the first validation. Call again after
+        reconfiguring a provider whose supported sizes, styles, formats,
+        models, or batch limit can change at runtime.
+        """
+        self._cached_sizes = frozenset(self.supported_sizes)
+        self._cached_styles = frozenset(self.supported_styles)
+        self._cached_formats = frozenset(self.supported_formats)
+        self._cached_models = frozenset(self.get_available_models())
+        self._cached_max_images = self.max_images_per_request
+        self._capabilities_cached = True
+    
     def validate_request(self, request: ImageRequest) -> List[str]:
         """Validate an image request against provider capabilities.
         
@@ -222,38 +254,41 @@ class BaseImageProvider(ABC):
         Returns:
             List of validation error messages (empty if valid)
         """
+        if not self._capabilities_cached:
+            self.refresh_capabilities()
+        
         errors = []
         
         # Check size
-        if not self.supports_size(request.size):
+        if request.size not in self._cached_sizes:
             errors.append(
                 f"Size {request.size.value} not supported. "
-                f"Supported: {[s.value for s in self.supported_sizes]}"
+                f"Supported: {[s.value for s in self._cached_sizes]}"
             )
         
         # Check style
-        if not self.supports_style(request.style):
+        if request.style not in self._cached_styles:
             errors.append(
                 f"Style {request.style.value} not supported. "
-                f"Supported: {[s.value for s in self.supported_styles]}"
+                f"Supported: {[s.value for s in self._cached_styles]}"
             )
         
         # Check format
-        if not self.supports_format(request.format):
+        if request.format not in self._cached_formats:
             errors.append(
                 f"Format {request.format.value} not supported. "
-                f"Supported: {[f.value for f in self.supported_formats]}"
+                f"Supported: {[f.value for f in self._cached_formats]}"
             )
         
         # Check batch size
-        if request.num_images > self.max_images_per_request:
+        if request.num_images > self._cached_max_images:
             errors.append(
                 f"num_images ({request.num_images}) exceeds maximum "
-                f"({self.max_images_per_request})"
+                f"({self._cached_max_images})"
             )
         
         # Check model if specified
-        if request.model and not self.validate_model(request.model):
+        if request.model and request.model not in self._cached_models:
             errors.append(
                 f"Model '{request.model}' not available. "
                 f"Available: {self.get_available_models()}"
@@ -275,6 +310,7 @@ class MockImageProvider(BaseImageProvider):
     """
     
     AVAILABLE_MODELS = ["mock-image-v1", "mock-image-v2"]
+    PROVIDER_NAME = "MockImage"
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -283,7 +319,7 @@ class MockImageProvider(BaseImageProvider):
     
     @property
     def provider_name(self) -> str:
-        return "MockImage"
+        return self.PROVIDER_NAME
     
     async def generate_image(self, request: ImageRequest) -> ImageResponse:
         """Generate mock image response."""
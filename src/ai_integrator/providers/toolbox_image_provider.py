@@ -14,7 +14,7 @@ Usage:
     integrator.add_image_provider("toolbox", provider)
 """
 
-from typing import List, Optional, Dict, Any
+from typing import AbstractSet, List, Optional, Dict, Any
 import asyncio
 
 from ai_integrator.core.image_types import (
@@ -25,6 +25,7 @@ from ai_integrator.core.image_types import (
     GeneratedImage,
 )
 from ai_integrator.providers.base_image_provider import (
+    ALL_IMAGE_SIZES,
     BaseImageProvider,
     ImageGenerationError,
     ContentPolicyError,
@@ -74,6 +75,7 @@ class ToolboxImageProvider(BaseImageProvider):
     # DALL-E 3 specific size constraints
     DALLE3_SIZES = {ImageSize.LARGE, ImageSize.WIDE, ImageSize.TALL, ImageSize.SQUARE_HD}
     DALLE2_SIZES = {ImageSize.SMALL, ImageSize.MEDIUM, ImageSize.LARGE}
+    SUPPORTED_SIZES = frozenset(DALLE3_SIZES | DALLE2_SIZES)
     
     def __init__(
         self,
@@ -81,6 +83,7 @@ class ToolboxImageProvider(BaseImageProvider):
         api_key: str = "",
         timeout: float = 120.0,
         endpoint: str = "/api/vision/generate",
+        http_client: Optional[Any] = None,
         **kwargs,
     ):
         """
@@ -91,12 +94,16 @@ class ToolboxImageProvider(BaseImageProvider):
             api_key: API key for authentication (passed to toolbox)
             timeout: Request timeout in seconds
             endpoint: API endpoint for image generation
+            http_client: Pre-built httpx.AsyncClient to use instead of
+                creating one (e.g. an ASGI-transport client in tests).
+                The caller keeps ownership; close() leaves it open.
             **kwargs: Additional configuration
         """
         super().__init__(api_key=api_key, timeout=timeout, **kwargs)
         self.base_url = toolbox_base_url.rstrip("/")
         self.endpoint = endpoint
-        self._client = None
+        self._client = http_client
+        self._owns_client = http_client is None
     
     @property
     def provider_name(self) -> str:
@@ -124,8 +131,8 @@ class ToolboxImageProvider(BaseImageProvider):
         return self._client
     
     async def close(self):
-        """Close the HTTP client."""
-        if self._client is not None:
+        """Close the HTTP client (injected clients are left to their owner)."""
+        if self._client is not None and self._owns_client:
             await self._client.aclose()
             self._client = None
     
@@ -290,11 +297,11 @@ class ToolboxImageProvider(BaseImageProvider):
         return self.AVAILABLE_MODELS.copy()
     
     @property
-    def supported_sizes(self):
+    def supported_sizes(self) -> AbstractSet[ImageSize]:
         """Get supported image sizes (union of all backends)."""
-        return self.DALLE3_SIZES | self.DALLE2_SIZES
+        return self.SUPPORTED_SIZES
     
-    def get_model_sizes(self, model: str) -> set:
+    def get_model_sizes(self, model: str) -> AbstractSet[ImageSize]:
         """Get supported sizes for a specific model."""
         if model.startswith("dall-e-3"):
             return self.DALLE3_SIZES
@@ -302,5 +309,5 @@ class ToolboxImageProvider(BaseImageProvider):
             return self.DALLE2_SIZES
         else:
             # Stable Diffusion typically supports all
-            return set(ImageSize)
+            return ALL_IMAGE_SIZES
 
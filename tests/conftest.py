@@ -2,12 +2,61 @@
 
 import sys
 from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
+from pytest_asyncio import is_async_test
 
 # Add src to path for imports
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
+# tools/ is a script directory, not a package; put it on the path too
+tools_path = Path(__file__).parent.parent / "tools"
+sys.path.insert(0, str(tools_path))
+
 # Configure pytest-asyncio
 pytest_plugins = ["pytest_asyncio"]
+
+
+def pytest_collection_modifyitems(items):
+    """Run all async tests on one session-scoped event loop.
+    
+    Mock providers complete without awaiting anything, so creating and
+    tearing down a fresh loop per test costs more than the test itself.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture
+def mock_toolbox_http_client():
+    """AsyncMock httpx client whose post() returns one DALL-E 3 image."""
+    response = MagicMock(status_code=200)
+    response.json.return_value = {
+        "images": [{"url": "https://example.com/img.png"}],
+        "model": "dall-e-3",
+    }
+    client = AsyncMock()
+    client.post.return_value = response
+    return client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def toolbox_asgi_client():
+    """httpx client wired in-process to tools/mock_toolbox_server.py.
+    
+    Requests go through the real FastAPI routing and validation via
+    ASGITransport, without starting uvicorn or opening a socket.
+    """
+    pytest.importorskip("fastapi")
+    import httpx
+    
+    from mock_toolbox_server import app
+    
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://toolbox") as client:
+        yield client
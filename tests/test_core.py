@@ -6,13 +6,25 @@ from ai_integrator.providers import MockProvider
 from ai_integrator.core.base import ModelNotFoundError
 
 
-@pytest.mark.asyncio
-async def test_basic_integration():
-    """Test basic integration with mock provider."""
+@pytest.fixture(scope="module")
+def integrator_with_mock():
+    """Shared integrator wired to a mock provider, for read-only tests."""
     integrator = AIIntegrator()
     mock_provider = MockProvider()
-
     integrator.add_provider("mock", mock_provider)
+    return integrator, mock_provider
+
+
+@pytest.fixture
+def integrator():
+    """Fresh integrator for tests that mutate the provider registry."""
+    return AIIntegrator()
+
+
+@pytest.mark.asyncio
+async def test_basic_integration(integrator_with_mock):
+    """Test basic integration with mock provider."""
+    integrator, _ = integrator_with_mock
 
     response = await integrator.generate(prompt="Hello, AI!", model="mock-small")
 
@@ -22,8 +34,7 @@ async def test_basic_integration():
     assert response.model == "mock-small"
 
 
-@pytest.mark.asyncio
-async def test_multiple_providers():
+def test_multiple_providers():
     """Test managing multiple providers."""
     integrator = AIIntegrator()
 
@@ -37,9 +48,8 @@ async def test_multiple_providers():
 
 
 @pytest.mark.asyncio
-async def test_default_provider():
+async def test_default_provider(integrator):
     """Test default provider setting."""
-    integrator = AIIntegrator()
     mock1 = MockProvider()
     mock2 = MockProvider()
 
@@ -60,14 +70,29 @@ async def test_invalid_model():
     integrator = AIIntegrator()
     integrator.add_provider("mock", MockProvider())
 
-    with pytest.raises(ModelNotFoundError):
+    with pytest.raises(ModelNotFoundError, match="nonexistent-model"):
         await integrator.generate(prompt="Test", model="nonexistent-model")
 
 
 @pytest.mark.asyncio
-async def test_remove_provider():
+async def test_generate_routes_by_model(integrator):
+    """Test model lookup falls back to the provider that serves it."""
+    other = MockProvider()
+    other.AVAILABLE_MODELS = ["other-model"]
+
+    integrator.add_provider("mock", MockProvider())
+    integrator.add_provider("other", other)
+
+    await integrator.generate(prompt="Test", model="other-model")
+    assert other.call_count == 1
+
+    integrator.remove_provider("other")
+    with pytest.raises(ModelNotFoundError):
+        await integrator.generate(prompt="Test", model="other-model")
+
+
+def test_remove_provider(integrator):
     """Test removing a provider."""
-    integrator = AIIntegrator()
     integrator.add_provider("mock", MockProvider())
 
     assert len(integrator.providers) == 1
@@ -94,9 +119,9 @@ async def test_parallel_generation():
     assert "mock2" in responses
 
 
-def test_provider_validation():
+def test_provider_validation(integrator_with_mock):
     """Test provider model validation."""
-    provider = MockProvider()
+    _, provider = integrator_with_mock
 
     assert provider.validate_model("mock-small") is True
     assert provider.validate_model("invalid-model") is False
@@ -1,5 +1,7 @@
 """Tests for ImageCoach and DesignContext."""
 
+from dataclasses import replace
+
 import pytest
 
 from ai_integrator.coaching.image_coach import (
@@ -53,6 +55,13 @@ class TestDesignContext:
         assert data["guitar_type"] == "dreadnought"
         assert data["component"] == "headstock"
         assert data["wood_type"] == "mahogany"
+    
+    def test_context_is_immutable(self):
+        """Test that contexts cannot be mutated in place."""
+        context = DesignContext(guitar_type="classical")
+        
+        with pytest.raises(AttributeError):
+            context.guitar_type = "dreadnought"
 
 
 class TestGuitarComponentEnum:
@@ -289,6 +298,31 @@ class TestImageCoachVariations:
             assert v.guitar_type == "classical"
             assert v.component == GuitarComponent.ROSETTE
     
+    def test_variations_preserve_secondary_wood(self, coach):
+        """Test that variations keep fields not being varied."""
+        base = DesignContext(
+            component=GuitarComponent.BINDING,
+            secondary_wood=WoodType.MAPLE,
+        )
+        variations = coach.suggest_variations(base, variation_type="wood", count=2)
+        
+        assert all(v.secondary_wood == WoodType.MAPLE for v in variations)
+    
+    def test_variations_do_not_share_reference_images(self, coach):
+        """Variations hold an immutable copy of the base's reference images."""
+        refs = ["https://example.com/ref.png"]
+        base = DesignContext(component=GuitarComponent.ROSETTE, reference_images=refs)
+        variations = coach.suggest_variations(base, variation_type="wood", count=2)
+        refs.append("https://example.com/other.png")
+        
+        assert base.reference_images == ("https://example.com/ref.png",)
+        for v in variations:
+            assert v.reference_images is not refs
+            assert v.reference_images == base.reference_images
+            assert isinstance(v.reference_images, tuple)
+        assert hash(base) == hash(replace(base))
+        assert base.to_dict()["reference_images"] == ["https://example.com/ref.png"]
+    
     def test_finish_variations(self, coach):
         """Test suggesting finish variations."""
         base = DesignContext(
@@ -235,4 +235,24 @@ class TestRestrictedProvider:
         request = ImageRequest(prompt="test", num_images=3)
         errors = provider.validate_request(request)
         assert len(errors) == 1
-
+    
+    def test_refresh_capabilities(self):
+        """Test validation picks up capability changes after refresh."""
+        
+        class ConfigurableProvider(MockImageProvider):
+            max_images = 4
+            
+            @property
+            def max_images_per_request(self):
+                return self.max_images
+        
+        provider = ConfigurableProvider()
+        request = ImageRequest(prompt="test", num_images=3)
+        assert provider.validate_request(request) == []
+        
+        provider.max_images = 2
+        provider.refresh_capabilities()
+        
+        errors = provider.validate_request(request)
+        assert len(errors) == 1
+        assert "num_images" in errors[0]
@@ -14,20 +14,25 @@ from ai_integrator.core.image_types import (
 class TestImageSize:
     """Tests for ImageSize enum."""
     
-    def test_size_values(self):
+    @pytest.mark.parametrize("size,expected", [
+        (ImageSize.SMALL, "256x256"),
+        (ImageSize.MEDIUM, "512x512"),
+        (ImageSize.LARGE, "1024x1024"),
+        (ImageSize.WIDE, "1792x1024"),
+        (ImageSize.TALL, "1024x1792"),
+    ])
+    def test_size_value(self, size, expected):
         """Test size enum values."""
-        assert ImageSize.SMALL.value == "256x256"
-        assert ImageSize.MEDIUM.value == "512x512"
-        assert ImageSize.LARGE.value == "1024x1024"
-        assert ImageSize.WIDE.value == "1792x1024"
-        assert ImageSize.TALL.value == "1024x1792"
+        assert size.value == expected
     
-    def test_size_dimensions(self):
+    @pytest.mark.parametrize("size,width,height", [
+        (ImageSize.LARGE, 1024, 1024),
+        (ImageSize.WIDE, 1792, 1024),
+    ])
+    def test_size_dimensions(self, size, width, height):
         """Test width/height properties."""
-        assert ImageSize.LARGE.width == 1024
-        assert ImageSize.LARGE.height == 1024
-        assert ImageSize.WIDE.width == 1792
-        assert ImageSize.WIDE.height == 1024
+        assert size.width == width
+        assert size.height == height
     
     def test_is_square(self):
         """Test square detection."""
@@ -51,12 +56,15 @@ class TestImageStyle:
 class TestImageFormat:
     """Tests for ImageFormat enum."""
     
-    def test_format_values(self):
+    @pytest.mark.parametrize("fmt,expected", [
+        (ImageFormat.PNG, "png"),
+        (ImageFormat.JPEG, "jpeg"),
+        (ImageFormat.WEBP, "webp"),
+        (ImageFormat.B64_JSON, "b64_json"),
+    ])
+    def test_format_value(self, fmt, expected):
         """Test format enum values."""
-        assert ImageFormat.PNG.value == "png"
-        assert ImageFormat.JPEG.value == "jpeg"
-        assert ImageFormat.WEBP.value == "webp"
-        assert ImageFormat.B64_JSON.value == "b64_json"
+        assert fmt.value == expected
 
 
 class TestImageRequest:
@@ -5,6 +5,23 @@ from ai_integrator import AIIntegrator, ImageSize, ImageStyle
 from ai_integrator.providers import MockImageProvider
 
 
+@pytest.fixture(scope="class")
+def image_integrator():
+    """Shared integrator with one mock image provider, for read-only tests."""
+    integrator = AIIntegrator()
+    integrator.add_image_provider("mock", MockImageProvider())
+    return integrator
+
+
+@pytest.fixture(scope="class")
+def parallel_integrator():
+    """Shared integrator with two mock image providers, for read-only tests."""
+    integrator = AIIntegrator()
+    integrator.add_image_provider("mock1", MockImageProvider())
+    integrator.add_image_provider("mock2", MockImageProvider())
+    return integrator
+
+
 class TestImageProviderRegistry:
     """Tests for image provider registration."""
     
@@ -98,16 +115,10 @@ class TestImageProviderRegistry:
 class TestGenerateImage:
     """Tests for generate_image method."""
     
-    @pytest.fixture
-    def integrator(self):
-        integrator = AIIntegrator()
-        integrator.add_image_provider("mock", MockImageProvider())
-        return integrator
-    
     @pytest.mark.asyncio
-    async def test_generate_image_basic(self, integrator):
+    async def test_generate_image_basic(self, image_integrator):
         """Test basic image generation."""
-        response = await integrator.generate_image(
+        response = await image_integrator.generate_image(
             prompt="A guitar rosette",
         )
         
@@ -115,9 +126,9 @@ class TestGenerateImage:
         assert response.provider == "MockImage"
     
     @pytest.mark.asyncio
-    async def test_generate_image_with_options(self, integrator):
+    async def test_generate_image_with_options(self, image_integrator):
         """Test image generation with options."""
-        response = await integrator.generate_image(
+        response = await image_integrator.generate_image(
             prompt="A guitar rosette",
             size=ImageSize.WIDE,
             style=ImageStyle.ARTISTIC,
@@ -127,9 +138,9 @@ class TestGenerateImage:
         assert response.image_count == 3
     
     @pytest.mark.asyncio
-    async def test_generate_image_named_provider(self, integrator):
+    async def test_generate_image_named_provider(self, image_integrator):
         """Test generating with named provider."""
-        response = await integrator.generate_image(
+        response = await image_integrator.generate_image(
             prompt="A guitar rosette",
             provider="mock",
         )
@@ -137,9 +148,9 @@ class TestGenerateImage:
         assert response.provider == "MockImage"
     
     @pytest.mark.asyncio
-    async def test_generate_image_with_negative_prompt(self, integrator):
+    async def test_generate_image_with_negative_prompt(self, image_integrator):
         """Test generating with negative prompt."""
-        response = await integrator.generate_image(
+        response = await image_integrator.generate_image(
             prompt="A guitar rosette",
             negative_prompt="blurry, low quality",
         )
@@ -147,10 +158,10 @@ class TestGenerateImage:
         assert response.image_count >= 1
     
     @pytest.mark.asyncio
-    async def test_generate_image_invalid_request(self, integrator):
+    async def test_generate_image_invalid_request(self, image_integrator):
         """Test that invalid request raises ValueError."""
         with pytest.raises(ValueError, match="num_images"):
-            await integrator.generate_image(
+            await image_integrator.generate_image(
                 prompt="test",
                 num_images=10,  # Exceeds max of 4 for mock
             )
@@ -190,17 +201,10 @@ class TestListImageProviders:
 class TestGenerateImagesParallel:
     """Tests for generate_images_parallel method."""
     
-    @pytest.fixture
-    def integrator(self):
-        integrator = AIIntegrator()
-        integrator.add_image_provider("mock1", MockImageProvider())
-        integrator.add_image_provider("mock2", MockImageProvider())
-        return integrator
-    
     @pytest.mark.asyncio
-    async def test_parallel_generation(self, integrator):
+    async def test_parallel_generation(self, parallel_integrator):
         """Test parallel image generation."""
-        results = await integrator.generate_images_parallel(
+        results = await parallel_integrator.generate_images_parallel(
             prompt="Guitar rosette",
             providers_config={
                 "mock1": {"size": ImageSize.LARGE},
@@ -214,9 +218,9 @@ class TestGenerateImagesParallel:
         assert results["mock2"].image_count >= 1
     
     @pytest.mark.asyncio
-    async def test_parallel_with_error(self, integrator):
+    async def test_parallel_with_error(self, parallel_integrator):
         """Test parallel generation with one failing."""
-        results = await integrator.generate_images_parallel(
+        results = await parallel_integrator.generate_images_parallel(
             prompt="Guitar rosette",
             providers_config={
                 "mock1": {"size": ImageSize.LARGE},
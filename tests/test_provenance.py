@@ -1,7 +1,11 @@
 """Tests for provenance envelope functionality."""
 
+from datetime import datetime, timezone
+
 import pytest
+from ai_integrator.core.image_types import ImageSize
 from ai_integrator.core.provenance import (
+    HASH_ALGORITHM,
     ProvenanceEnvelope,
     create_provenance,
     validate_provenance,
@@ -61,6 +65,21 @@ class TestProvenanceEnvelope:
         assert restored.request_id == original.request_id
         assert restored.model_id == original.model_id
         assert restored.weights_hash == original.weights_hash
+    
+    def test_msgpack_roundtrip(self):
+        """to_msgpack/from_msgpack should reconstruct envelope."""
+        pytest.importorskip("msgpack")
+        original = ProvenanceEnvelope(
+            request_id="test-123",
+            timestamp="2025-01-29T12:00:00Z",
+            model_id="dall-e-3",
+            provider_name="ToolboxImage",
+            policies_applied=["no-recommendations"],
+        )
+        
+        restored = ProvenanceEnvelope.from_msgpack(original.to_msgpack())
+        
+        assert restored == original
 
 
 class TestCreateProvenance:
@@ -98,6 +117,13 @@ class TestCreateProvenance:
         
         assert prov1.input_hash == prov2.input_hash
     
+    def test_create_provenance_records_hash_algorithm(self):
+        """Envelopes name the algorithm behind their input hashes."""
+        provenance = create_provenance("gpt-4", "OpenAI", input_content="G major")
+        
+        assert provenance.hash_algorithm == HASH_ALGORITHM == "blake2b-64"
+        assert provenance.to_dict()["hash_algorithm"] == "blake2b-64"
+    
     def test_create_provenance_with_template(self):
         """Include template version for replay."""
         provenance = create_provenance(
@@ -192,6 +218,11 @@ class TestHashUtilities:
         hash_value = hash_content("test")
         assert len(hash_value) == 16
     
+    def test_hash_known_answers(self):
+        """Pin the BLAKE2b-64 digests so algorithm changes are caught."""
+        assert hash_content("test") == "96ad3bb4a2d666d3"
+        assert hash_input_packet({"prompt": "Explain G major"}) == "a86bfd0c8731ab8d"
+    
     def test_hash_dict_deterministic(self):
         """Dict hashing is deterministic regardless of key order."""
         dict1 = {"a": 1, "b": 2, "c": 3}
@@ -220,6 +251,39 @@ class TestHashUtilities:
         assert " " not in result  # No spaces
         assert "\n" not in result  # No newlines
     
+    def test_canonical_json_utf8(self):
+        """canonical_json keeps non-ASCII text as UTF-8."""
+        assert canonical_json({"wood": "épicéa"}) == '{"wood":"épicéa"}'
+    
+    def test_canonical_json_big_int(self):
+        """Integers beyond 64 bits serialize exactly instead of raising."""
+        assert canonical_json({"seed": 2**64}) == '{"seed":18446744073709551616}'
+        assert hash_input_packet({"seed": 2**64}) != hash_input_packet({"seed": 2**64 - 1})
+    
+    def test_canonical_json_nan_distinct_from_null(self):
+        """NaN and infinities never hash the same as None."""
+        hashes = {
+            hash_input_packet({"a": value})
+            for value in (None, float("nan"), float("inf"), float("-inf"))
+        }
+        assert len(hashes) == 4
+    
+    def test_canonical_json_datetime_uses_str(self):
+        """Datetimes use their str() form, like other non-JSON types."""
+        when = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert canonical_json({"at": when}) == '{"at":"2024-01-01 00:00:00+00:00"}'
+    
+    def test_canonical_json_enum_uses_str(self):
+        """Enums use their str() form."""
+        assert canonical_json({"size": ImageSize.LARGE}) == '{"size":"ImageSize.LARGE"}'
+    
+    @pytest.mark.parametrize("neighbour", [2**64, float("nan")])
+    def test_canonical_json_independent_of_neighbours(self, neighbour):
+        """A value serializes the same whatever else is in the dict."""
+        for value, expected in [(ImageSize.LARGE, '"ImageSize.LARGE"'), (1e16, "1e+16")]:
+            assert canonical_json({"v": value}) == '{"v":%s}' % expected
+            assert canonical_json({"v": value, "w": neighbour}).startswith('{"v":%s,' % expected)
+    
     def test_hash_input_packet_deterministic(self):
         """hash_input_packet is deterministic for same logical content."""
         packet1 = {
@@ -0,0 +1,185 @@
+"""Tests for the knowledge base seeder (tools/seed_knowledge_base.py)."""
+
+import json
+import os
+
+import pytest
+
+from seed_knowledge_base import (
+    extract_instruments,
+    extract_vocabulary,
+    seed_knowledge_base,
+)
+
+
+VOCAB_PATH = "services/api/app/vision/vocabulary.py"
+
+CATALOGS = {
+    "services/api/app/instrument_geometry/instrument_model_registry.json": {
+        "models": {
+            "strat": {"display_name": "Stratocaster", "category": "electric"},
+            "om": {"category": "acoustic", "scale_length_mm": 645.2},
+        },
+    },
+    "services/api/app/instrument_geometry/body/catalog.json": {
+        "bodies": {"dread": {"name": "Dreadnought", "category": "acoustic"}},
+        "categories": {"acoustic": ["dread"]},
+    },
+    "services/api/app/data/rosette_pattern_catalog.json": {
+        "categories": {"rope": [{"id": "r1", "name": "Rope"}]},
+    },
+}
+
+
+@pytest.fixture
+def write_vocab(tmp_path):
+    """Write a vocabulary.py into a toolbox tree under tmp_path."""
+    def write(source: str):
+        path = tmp_path / VOCAB_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding="utf-8")
+        return tmp_path
+    return write
+
+
+@pytest.fixture
+def toolbox(write_vocab, tmp_path):
+    """A complete toolbox tree with every catalog the seeder reads."""
+    for rel_path, data in CATALOGS.items():
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data), encoding="utf-8")
+    return write_vocab('WOODS = ["spruce", "cedar"]\nFINISHES = ["nitro"]\n')
+
+
+class TestExtractVocabulary:
+    """Tests for vocabulary.py parsing."""
+
+    def test_annotated_and_plain_assignments(self, write_vocab):
+        """Both NAME: List[str] = [...] and NAME = [...] are read."""
+        toolbox = write_vocab(
+            "from typing import List\n"
+            'WOODS: List[str] = ["spruce", "cedar"]\n'
+            'INLAYS = ["dots", "blocks"]\n'
+        )
+        vocab = extract_vocabulary(toolbox)["vocabulary"]
+
+        assert vocab["woods"] == ["spruce", "cedar"]
+        assert vocab["inlays"] == ["dots", "blocks"]
+
+    def test_single_quoted_items(self, write_vocab):
+        """Single-quoted strings are read like double-quoted ones."""
+        toolbox = write_vocab("FINISHES = ['nitro', \"poly\"]\n")
+
+        assert extract_vocabulary(toolbox)["vocabulary"]["finishes"] == ["nitro", "poly"]
+
+    def test_items_containing_brackets(self, write_vocab):
+        """A ']' inside an item does not end the list."""
+        toolbox = write_vocab('WOODS = ["Indian rosewood [EIR]", "maple"]\n')
+
+        assert extract_vocabulary(toolbox)["vocabulary"]["woods"] == [
+            "Indian rosewood [EIR]",
+            "maple",
+        ]
+
+    def test_non_literal_values_skipped(self, write_vocab):
+        """Lists built from other names, and non-string items, are skipped."""
+        toolbox = write_vocab(
+            'BASE = ["spruce"]\n'
+            'WOODS = BASE + ["cedar"]\n'
+            'HARDWARE = ["tuners", 3, None]\n'
+        )
+        vocab = extract_vocabulary(toolbox)["vocabulary"]
+
+        assert vocab["woods"] == []
+        assert vocab["hardware"] == ["tuners"]
+
+    def test_counts(self, write_vocab):
+        """Counts mirror the extracted list lengths."""
+        toolbox = write_vocab('WOODS = ["spruce", "cedar"]\n')
+
+        assert extract_vocabulary(toolbox)["counts"]["woods"] == 2
+
+    def test_syntax_error_reported(self, write_vocab, capsys):
+        """Unparseable source is reported instead of scanned with a regex."""
+        toolbox = write_vocab('WOODS = ["spruce"]\ntype X = int\nthis is not python\n')
+        result = extract_vocabulary(toolbox)
+
+        assert result["error"] == "syntax_error"
+        assert "vocabulary" not in result
+        assert "WARN: Could not parse" in capsys.readouterr().err
+
+    def test_missing_file(self, tmp_path):
+        """A missing vocabulary.py is reported, not raised."""
+        result = extract_vocabulary(tmp_path)
+
+        assert result["error"] == "not_found"
+        assert result["source"].endswith("vocabulary.py")
+
+
+class TestExtractInstruments:
+    """Tests for instrument registry extraction."""
+
+    def test_defaults_and_nulls(self, toolbox):
+        """Absent fields get defaults; explicit nulls are kept as None."""
+        registry = toolbox / next(iter(CATALOGS))
+        registry.write_text(json.dumps({
+            "models": {"lp": {"display_name": None, "category": "electric"}},
+        }), encoding="utf-8")
+        model = extract_instruments(toolbox)["models"][0]
+
+        assert model.display_name is None
+        assert model.status == "STUB"
+        assert model.description == ""
+
+
+class TestSeedKnowledgeBase:
+    """Tests for seeding output files and the manifest."""
+
+    def _data_files(self, output_dir):
+        return sorted(p for p in output_dir.rglob("*.json") if p.name != "manifest.json")
+
+    def test_reseed_is_stable(self, toolbox, tmp_path):
+        """Re-seeding unchanged sources keeps bytes, mtimes and hashes."""
+        output_dir = tmp_path / "knowledge"
+        first = seed_knowledge_base(toolbox, output_dir, quiet=True)
+        files = self._data_files(output_dir)
+        contents = {p: p.read_bytes() for p in files}
+        for p in files:
+            os.utime(p, (1_000_000_000, 1_000_000_000))
+
+        second = seed_knowledge_base(toolbox, output_dir, quiet=True)
+
+        assert {p: p.read_bytes() for p in files} == contents
+        assert all(p.stat().st_mtime == 1_000_000_000 for p in files)
+        assert second["files"] == first["files"]
+
+    def test_output_keys_sorted(self, toolbox, tmp_path):
+        """Output files are written with sorted keys."""
+        output_dir = tmp_path / "knowledge"
+        seed_knowledge_base(toolbox, output_dir, quiet=True)
+        models = json.loads((output_dir / "lutherie/instruments.json").read_text())["models"]
+
+        assert list(models[0]) == sorted(models[0])
+
+    def test_quiet_suppresses_summary(self, toolbox, tmp_path, capsys):
+        """quiet=True writes nothing to stdout."""
+        seed_knowledge_base(toolbox, tmp_path / "knowledge", quiet=True)
+
+        assert capsys.readouterr().out == ""
+
+    def test_quiet_keeps_warnings(self, tmp_path, capsys):
+        """Missing-file warnings still reach stderr with quiet=True."""
+        seed_knowledge_base(tmp_path / "toolbox", tmp_path / "knowledge", quiet=True)
+        captured = capsys.readouterr()
+
+        assert captured.out == ""
+        assert "WARN: File not found" in captured.err
+
+    def test_summary_printed(self, toolbox, tmp_path, capsys):
+        """Without quiet, the summary reports the extracted counts."""
+        seed_knowledge_base(toolbox, tmp_path / "knowledge")
+        out = capsys.readouterr().out
+
+        assert "KNOWLEDGE BASE SEEDING COMPLETE" in out
+        assert "Instruments:  2" in out
@@ -1,7 +1,6 @@
 """Tests for ToolboxImageProvider."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 
 from ai_integrator.core.image_types import (
     ImageRequest,
@@ -19,6 +18,19 @@ from ai_integrator.providers.base_image_provider import (
 )
 
 
+@pytest.fixture(scope="module")
+def provider():
+    """Shared provider; tests only call its pure helpers or patch per-test."""
+    return ToolboxImageProvider()
+
+
+@pytest.fixture
+def provider_with_mock(provider, mock_toolbox_http_client, monkeypatch):
+    """Shared provider routed to the mock HTTP client for one test."""
+    monkeypatch.setattr(provider, "_get_client", lambda: mock_toolbox_http_client)
+    return provider
+
+
 class TestToolboxImageProviderInit:
     """Tests for provider initialization."""
     
@@ -42,40 +54,31 @@ class TestToolboxImageProviderInit:
         assert provider.timeout == 60.0
         assert provider.endpoint == "/v2/generate"
     
-    def test_provider_name(self):
+    def test_provider_name(self, provider):
         """Test provider name."""
-        provider = ToolboxImageProvider()
         assert provider.provider_name == "ToolboxImage"
     
-    def test_available_models(self):
+    def test_available_models(self, provider):
         """Test available models list."""
-        provider = ToolboxImageProvider()
         models = provider.get_available_models()
         assert "dall-e-3" in models
         assert "dall-e-2" in models
         assert "stable-diffusion-xl" in models
 
 
-class TestToolboxImageProviderPayload:
-    """Tests for request payload building."""
-    
-    @pytest.fixture
-    def provider(self):
-        return ToolboxImageProvider()
-    
-    def test_build_minimal_payload(self, provider):
-        """Test building payload from minimal request."""
-        request = ImageRequest(prompt="test prompt")
-        payload = provider._build_request_payload(request)
-        
-        assert payload["prompt"] == "test prompt"
-        assert payload["size"] == "1024x1024"
-        assert payload["num_images"] == 1
-        assert payload["quality"] == "standard"
-    
-    def test_build_full_payload(self, provider):
-        """Test building payload with all options."""
-        request = ImageRequest(
+# (request, exact expected payload); built once at import
+PAYLOAD_CASES = {
+    "minimal": (
+        ImageRequest(prompt="test prompt"),
+        {
+            "prompt": "test prompt",
+            "size": "1024x1024",
+            "quality": "standard",
+            "num_images": 1,
+        },
+    ),
+    "full": (
+        ImageRequest(
             prompt="guitar rosette",
             negative_prompt="blurry",
             size=ImageSize.WIDE,
@@ -84,24 +87,37 @@ class TestToolboxImageProviderPayload:
             seed=42,
             model="dall-e-3",
             quality="hd",
-        )
-        payload = provider._build_request_payload(request)
-        
-        assert payload["prompt"] == "guitar rosette"
-        assert payload["size"] == "1792x1024"
-        assert payload["num_images"] == 4
-        assert payload["model"] == "dall-e-3"
-        assert payload["quality"] == "hd"
-        assert payload["provider"] == "openai"  # Inferred from dall-e-3
+        ),
+        {
+            "prompt": "guitar rosette",
+            "size": "1792x1024",
+            "quality": "hd",
+            "num_images": 4,
+            "model": "dall-e-3",
+            "provider": "openai",  # Inferred from dall-e-3
+        },
+    ),
+}
+
+
+@pytest.fixture(params=list(PAYLOAD_CASES), scope="module")
+def payload_case(request):
+    """(ImageRequest, expected payload) pair for each PAYLOAD_CASES entry."""
+    return PAYLOAD_CASES[request.param]
+
+
+class TestToolboxImageProviderPayload:
+    """Tests for request payload building."""
+    
+    def test_build_payload(self, provider, payload_case):
+        """Test the payload matches the golden dict exactly."""
+        image_request, expected = payload_case
+        assert provider._build_request_payload(image_request) == expected
 
 
 class TestToolboxImageProviderInputPacket:
     """Tests for input packet building (for provenance)."""
     
-    @pytest.fixture
-    def provider(self):
-        return ToolboxImageProvider()
-    
     def test_build_input_packet(self, provider):
         """Test input packet contains all relevant fields."""
         request = ImageRequest(
@@ -119,10 +135,6 @@ class TestToolboxImageProviderInputPacket:
 class TestToolboxImageProviderValidation:
     """Tests for request validation."""
     
-    @pytest.fixture
-    def provider(self):
-        return ToolboxImageProvider()
-    
     def test_supported_sizes(self, provider):
         """Test supported sizes includes DALL-E sizes."""
         sizes = provider.supported_sizes
@@ -142,10 +154,6 @@ class TestToolboxImageProviderValidation:
 class TestToolboxImageProviderResponseParsing:
     """Tests for response parsing."""
     
-    @pytest.fixture
-    def provider(self):
-        return ToolboxImageProvider()
-    
     def test_parse_url_response(self, provider):
         """Test parsing response with image URLs."""
         request = ImageRequest(prompt="test")
@@ -184,46 +192,28 @@ class TestToolboxImageProviderResponseParsing:
 class TestToolboxImageProviderErrorHandling:
     """Tests for error handling."""
     
-    @pytest.fixture
-    def provider(self):
-        return ToolboxImageProvider()
-    
-    def test_auth_error(self, provider):
-        """Test 401 maps to ImageGenerationError."""
-        with pytest.raises(ImageGenerationError, match="Authentication"):
-            provider._handle_error(Exception("unauthorized"), status_code=401)
-    
-    def test_rate_limit_error(self, provider):
-        """Test 429 maps to ImageQuotaError."""
-        with pytest.raises(ImageQuotaError, match="Rate limit"):
-            provider._handle_error(Exception("too many requests"), status_code=429)
-    
-    def test_content_policy_error(self, provider):
-        """Test content policy violation."""
-        with pytest.raises(ContentPolicyError, match="Content policy"):
-            provider._handle_error(
-                Exception("content_policy_violation"),
-                status_code=400,
-            )
-    
-    def test_server_error(self, provider):
-        """Test 500+ maps to ToolboxConnectionError."""
-        with pytest.raises(ToolboxConnectionError, match="server error"):
-            provider._handle_error(Exception("internal error"), status_code=500)
-    
-    def test_connection_error(self, provider):
-        """Test connection failure."""
-        with pytest.raises(ToolboxConnectionError, match="connect"):
-            provider._handle_error(Exception("Failed to connect to host"))
+    @pytest.mark.parametrize("status_code,message,exc_type,match", [
+        pytest.param(401, "unauthorized", ImageGenerationError, "Authentication", id="auth"),
+        pytest.param(429, "too many requests", ImageQuotaError, "Rate limit", id="rate-limit"),
+        pytest.param(
+            400, "content_policy_violation", ContentPolicyError, "Content policy",
+            id="content-policy",
+        ),
+        pytest.param(500, "internal error", ToolboxConnectionError, "server error", id="server"),
+        pytest.param(
+            None, "Failed to connect to host", ToolboxConnectionError, "connect",
+            id="connection",
+        ),
+    ])
+    def test_error_mapping(self, provider, status_code, message, exc_type, match):
+        """Test status codes and messages map to ai-integrator exceptions."""
+        with pytest.raises(exc_type, match=match):
+            provider._handle_error(Exception(message), status_code=status_code)
 
 
 class TestToolboxImageProviderGeneration:
     """Tests for the generate_image method."""
     
-    @pytest.fixture
-    def provider(self):
-        return ToolboxImageProvider()
-    
     @pytest.mark.asyncio
     async def test_invalid_request_raises(self, provider):
         """Test that invalid request raises ImageGenerationError."""
@@ -232,25 +222,29 @@ class TestToolboxImageProviderGeneration:
         with pytest.raises(ImageGenerationError, match="Invalid request"):
             await provider.generate_image(request)
     
+    @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_generate_creates_provenance(self, provider):
+    async def test_generate_creates_provenance(self, provider_with_mock):
         """Test that generate creates provenance envelope."""
-        # Mock the HTTP client
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "images": [{"url": "https://example.com/img.png"}],
-            "model": "dall-e-3",
-        }
-        
-        mock_client = AsyncMock()
-        mock_client.post.return_value = mock_response
-        
-        with patch.object(provider, '_get_client', return_value=mock_client):
-            request = ImageRequest(prompt="test rosette")
-            response = await provider.generate_image(request)
+        response = await provider_with_mock.generate_image(ImageRequest(prompt="test rosette"))
         
         assert response.metadata is not None
         assert "provenance" in response.metadata
         assert response.metadata["provenance"]["provider_name"] == "ToolboxImage"
-
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_generate_against_mock_server(self, toolbox_asgi_client):
+        """Test a full round trip through the mock toolbox app."""
+        provider = ToolboxImageProvider(
+            endpoint="/api/ai/image/generate",
+            http_client=toolbox_asgi_client,
+        )
+        request = ImageRequest(prompt="test rosette", model="dall-e-3")
+        response = await provider.generate_image(request)
+        
+        assert response.image_count == 1
+        assert response.model == "dall-e-3"
+        assert response.images[0].revised_prompt.startswith("[Revised by DALL-E 3]")
+        assert response.usage["currency"] == "USD"
+        assert response.metadata["provenance"]["provider_name"] == "ToolboxImage"
@@ -20,51 +20,38 @@ from ai_integrator.core.validation import (
 class TestValidateProviderConfig:
     """Tests for individual provider config validation."""
     
-    def test_valid_openai_config(self):
-        """OpenAI provider requires api_key."""
-        errors = validate_provider_config("openai", {"api_key": "sk-test123"})
-        assert errors == []
-    
-    def test_missing_api_key_for_network_provider(self):
-        """Network providers require api_key."""
-        errors = validate_provider_config("openai", {"model": "gpt-4"})
-        assert len(errors) == 1
-        assert "api_key" in errors[0]
-        assert "openai" in errors[0]
-    
-    def test_empty_api_key_is_error(self):
-        """Empty api_key should be rejected."""
-        errors = validate_provider_config("openai", {"api_key": ""})
-        assert len(errors) == 1
-        assert "empty" in errors[0].lower()
-    
-    def test_local_provider_requires_model_path(self):
-        """Local providers require model_path instead of api_key."""
-        errors = validate_provider_config("local", {"model_path": "/models/llama.gguf"})
-        assert errors == []
-    
-    def test_local_provider_missing_model_path(self):
-        """Local provider without model_path should error."""
-        errors = validate_provider_config("local", {"device": "cuda"})
-        assert len(errors) == 1
-        assert "model_path" in errors[0]
-    
-    def test_unknown_provider_with_model_path_treated_as_local(self):
-        """Unknown provider with model_path is treated as local."""
-        errors = validate_provider_config("my-custom-engine", {"model_path": "/path/to/model"})
-        assert errors == []
-    
-    def test_unknown_provider_without_model_path_requires_api_key(self):
-        """Unknown provider without model_path requires api_key (assumed network)."""
-        errors = validate_provider_config("my-custom-api", {"base_url": "http://api.example.com"})
-        assert len(errors) == 1
-        assert "api_key" in errors[0]
-    
-    def test_non_dict_config_is_error(self):
-        """Provider config must be a dict."""
-        errors = validate_provider_config("openai", "not-a-dict")
-        assert len(errors) == 1
-        assert "expected dict" in errors[0]
+    # (provider, config, substrings the single error must contain; None = valid)
+    PROVIDER_CASES = [
+        pytest.param("openai", {"api_key": "sk-test123"}, None, id="openai-valid"),
+        pytest.param(
+            "openai", {"model": "gpt-4"}, ("api_key", "openai"),
+            id="network-missing-api-key",
+        ),
+        pytest.param("openai", {"api_key": ""}, ("empty",), id="empty-api-key"),
+        pytest.param("local", {"model_path": "/models/llama.gguf"}, None, id="local-valid"),
+        pytest.param("local", {"device": "cuda"}, ("model_path",), id="local-missing-model-path"),
+        pytest.param(
+            "my-custom-engine", {"model_path": "/path/to/model"}, None,
+            id="unknown-with-model-path-is-local",
+        ),
+        pytest.param(
+            "my-custom-api", {"base_url": "http://api.example.com"}, ("api_key",),
+            id="unknown-without-model-path-is-network",
+        ),
+        pytest.param("openai", "not-a-dict", ("expected dict",), id="non-dict-config"),
+    ]
+    
+    @pytest.mark.parametrize("provider_name,config,needles", PROVIDER_CASES)
+    def test_validate_provider_config(self, provider_name, config, needles):
+        """Valid configs produce no errors; invalid ones one actionable error."""
+        errors = validate_provider_config(provider_name, config)
+        
+        if needles is None:
+            assert errors == []
+        else:
+            assert len(errors) == 1
+            for needle in needles:
+                assert needle in errors[0]
 
 
 class TestValidateConfig:
@@ -6,11 +6,14 @@ the ai-integrator → toolbox integration.
 
 Usage:
     # Install uvicorn if needed
-    pip install uvicorn fastapi
+    pip install "uvicorn[standard]" fastapi
 
     # Run the mock server
     python tools/mock_toolbox_server.py
 
+    # ...with auto-reload while editing this file
+    MOCK_TOOLBOX_RELOAD=1 python tools/mock_toolbox_server.py
+
     # Or with uvicorn directly
     uvicorn tools.mock_toolbox_server:app --reload --port 8000
 
@@ -18,20 +21,41 @@ The server will be available at http://localhost:8000
 API docs at http://localhost:8000/docs
 """
 
+import os
+import re
 import uuid
 import time
+from collections import deque
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Deque
+
+import orjson
 
 try:
     from fastapi import FastAPI, HTTPException, Header
     from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import JSONResponse
     from pydantic import BaseModel, Field
 except ImportError:
     print("FastAPI required: pip install fastapi uvicorn")
     raise
 
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+    
+    Defined here because fastapi.responses.ORJSONResponse is deprecated
+    in recent FastAPI releases. Only used for routes that return plain
+    dicts: routes with a response_model are serialized faster by
+    FastAPI's own Pydantic fast path, which a custom response class
+    would disable.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # =============================================================================
 # Request/Response Models
 # =============================================================================
@@ -84,11 +108,36 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Track requests for debugging
-request_log: List[Dict[str, Any]] = []
+# Validation tables, built once rather than per request
+_VALID_MODELS = frozenset({"dall-e-3", "dall-e-2", "stable-diffusion-xl", "stable-diffusion-v1.5"})
+_DALLE3_SIZES = frozenset({"1024x1024", "1792x1024", "1024x1792"})
+_DALLE2_SIZES = frozenset({"256x256", "512x512", "1024x1024"})
+
+# Simulated content filter: one case-insensitive scan for any blocked term
+_BLOCKED_RE = re.compile("violence|hate|explicit", re.IGNORECASE)
+
+# Real pricing (as of 2024):
+# DALL-E 3 Standard 1024x1024: $0.040/image
+# DALL-E 3 HD 1024x1024: $0.080/image
+# DALL-E 2 1024x1024: $0.020/image
+_BASE_COSTS = {
+    "dall-e-3": 0.040,
+    "dall-e-2": 0.020,
+    "stable-diffusion-xl": 0.010,
+    "stable-diffusion-v1.5": 0.005,
+}
+
+# Track the last 100 requests for debugging (deque evicts the oldest)
+request_log: Deque[Dict[str, Any]] = deque(maxlen=100)
+
+
+@lru_cache(maxsize=128)
+def _iso_timestamp(epoch_seconds: int) -> str:
+    """Format a whole-second UTC timestamp, reusing it within that second."""
+    return datetime.fromtimestamp(epoch_seconds, timezone.utc).isoformat()
 
 
-@app.get("/")
+@app.get("/", response_class=ORJSONResponse)
 async def root():
     """Health check endpoint."""
     return {
@@ -98,13 +147,20 @@ async def root():
     }
 
 
-@app.get("/health")
+@app.get("/health", response_class=ORJSONResponse)
 async def health():
     """Health check for monitoring."""
-    return {"status": "healthy", "timestamp": datetime.now(timezone.utc).isoformat()}
+    return {"status": "healthy", "timestamp": _iso_timestamp(int(time.time()))}
 
 
-@app.post("/api/ai/image/generate", response_model=ImageGenerateResponse)
+# The response is built from trusted server-side values, so it is returned
+# as a plain dict instead of being re-validated against a response_model.
+# `responses=` keeps the schema in the OpenAPI docs.
+@app.post(
+    "/api/ai/image/generate",
+    response_class=ORJSONResponse,
+    responses={200: {"model": ImageGenerateResponse}},
+)
 async def generate_image(
     request: ImageGenerateRequest,
     authorization: Optional[str] = Header(None),
@@ -128,51 +184,42 @@ async def generate_image(
     # Log the request for debugging
     log_entry = {
         "id": request_id,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "created": created_at,  # Formatted on read by list_requests()
         "prompt": request.prompt[:100] + "..." if len(request.prompt) > 100 else request.prompt,
         "model": request.model or "dall-e-3",
         "n": request.n,
         "size": request.size,
     }
     request_log.append(log_entry)
-    if len(request_log) > 100:
-        request_log.pop(0)  # Keep last 100 requests
     
     # Determine model
     model = request.model or "dall-e-3"
     
     # Validate model
-    valid_models = ["dall-e-3", "dall-e-2", "stable-diffusion-xl", "stable-diffusion-v1.5"]
-    if model not in valid_models:
+    if model not in _VALID_MODELS:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid model '{model}'. Valid models: {valid_models}",
+            detail=f"Invalid model '{model}'. Valid models: {sorted(_VALID_MODELS)}",
         )
     
     # Validate size for model
-    dalle3_sizes = ["1024x1024", "1792x1024", "1024x1792"]
-    dalle2_sizes = ["256x256", "512x512", "1024x1024"]
-    
-    if model.startswith("dall-e-3") and request.size not in dalle3_sizes:
+    if model.startswith("dall-e-3") and request.size not in _DALLE3_SIZES:
         raise HTTPException(
             status_code=400,
-            detail=f"DALL-E 3 only supports sizes: {dalle3_sizes}",
+            detail=f"DALL-E 3 only supports sizes: {sorted(_DALLE3_SIZES)}",
         )
-    elif model.startswith("dall-e-2") and request.size not in dalle2_sizes:
+    elif model.startswith("dall-e-2") and request.size not in _DALLE2_SIZES:
         raise HTTPException(
             status_code=400,
-            detail=f"DALL-E 2 only supports sizes: {dalle2_sizes}",
+            detail=f"DALL-E 2 only supports sizes: {sorted(_DALLE2_SIZES)}",
         )
     
     # Simulate content policy check
-    blocked_terms = ["violence", "hate", "explicit"]
-    prompt_lower = request.prompt.lower()
-    for term in blocked_terms:
-        if term in prompt_lower:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Content policy violation: prompt contains blocked content",
-            )
+    if _BLOCKED_RE.search(request.prompt):
+        raise HTTPException(
+            status_code=400,
+            detail="Content policy violation: prompt contains blocked content",
+        )
     
     # Generate mock images
     images = []
@@ -189,23 +236,14 @@ async def generate_image(
         if model == "dall-e-3":
             revised_prompt = f"[Revised by DALL-E 3] {request.prompt[:200]}"
         
-        images.append(GeneratedImageData(
-            url=placeholder_url,
-            revised_prompt=revised_prompt,
-        ))
+        images.append({
+            "url": placeholder_url,
+            "revised_prompt": revised_prompt,
+            "b64_json": None,
+        })
     
     # Calculate mock usage/cost
-    # Real pricing (as of 2024):
-    # DALL-E 3 Standard 1024x1024: $0.040/image
-    # DALL-E 3 HD 1024x1024: $0.080/image
-    # DALL-E 2 1024x1024: $0.020/image
-    base_costs = {
-        "dall-e-3": 0.040,
-        "dall-e-2": 0.020,
-        "stable-diffusion-xl": 0.010,
-        "stable-diffusion-v1.5": 0.005,
-    }
-    cost_per_image = base_costs.get(model, 0.01)
+    cost_per_image = _BASE_COSTS.get(model, 0.01)
     if request.quality == "hd":
         cost_per_image *= 2
     
@@ -219,22 +257,26 @@ async def generate_image(
         "currency": "USD",
     }
     
-    return ImageGenerateResponse(
-        id=request_id,
-        created=created_at,
-        model=model,
-        images=images,
-        usage=usage,
-    )
+    return {
+        "id": request_id,
+        "created": created_at,
+        "model": model,
+        "images": images,
+        "usage": usage,
+    }
 
 
-@app.get("/api/ai/image/requests")
+@app.get("/api/ai/image/requests", response_class=ORJSONResponse)
 async def list_requests():
     """List recent requests for debugging."""
-    return {"requests": request_log, "count": len(request_log)}
+    requests = [
+        {**entry, "timestamp": _iso_timestamp(entry["created"])}
+        for entry in request_log
+    ]
+    return {"requests": requests, "count": len(requests)}
 
 
-@app.delete("/api/ai/image/requests")
+@app.delete("/api/ai/image/requests", response_class=ORJSONResponse)
 async def clear_requests():
     """Clear request log."""
     request_log.clear()
@@ -261,9 +303,14 @@ if __name__ == "__main__":
     print("Press Ctrl+C to stop")
     print("=" * 60)
     
+    # Reload forks a file watcher and re-imports the app, so it is opt-in.
+    # loop/http stay "auto": uvicorn picks uvloop and httptools when
+    # installed (uvicorn[standard]) and falls back cleanly, e.g. on Windows.
+    reload = os.environ.get("MOCK_TOOLBOX_RELOAD") == "1"
     uvicorn.run(
-        "mock_toolbox_server:app",
+        "mock_toolbox_server:app" if reload else app,
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
+        log_level="warning",
     )
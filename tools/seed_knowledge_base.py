@@ -28,30 +28,121 @@ Output:
     ├── patterns/
     │   └── rosettes.json         # Rosette patterns
     └── manifest.json             # Seed manifest with provenance
+
+All files are canonical JSON (sorted keys, 2-space indent, UTF-8), so
+re-seeding unchanged sources reproduces the same bytes and sha256s.
 """
 
 from __future__ import annotations
 
+import ast
 import json
 import argparse
 import hashlib
+import os
+import sys
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Standalone use without ai-integrator's dependencies
+    orjson = None
 
 
 # Default paths
 DEFAULT_TOOLBOX_PATH = Path(__file__).parent.parent.parent / "luthiers-toolbox"
 OUTPUT_DIR = Path(__file__).parent.parent / "knowledge"
 
+# The manifest hashes are content fingerprints, not security checks
+_SHA256_KWARGS: Dict[str, Any] = {"usedforsecurity": False} if sys.version_info >= (3, 9) else {}
+
+# `@dataclass(slots=True)` requires Python 3.10+
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class InstrumentModel:
+    """One instrument registry entry, as written to instruments.json."""
+
+    # Defaults only fill absent keys; registry rows may still carry null
+    id: str
+    display_name: Optional[str]
+    category: Optional[str]
+    scale_length_mm: Optional[float]
+    fret_count: Optional[int]
+    string_count: Optional[int]
+    manufacturer: Optional[str]
+    year_introduced: Optional[int]
+    status: Optional[str]
+    description: Optional[str]
+
+    def _asdict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "display_name": self.display_name,
+            "category": self.category,
+            "scale_length_mm": self.scale_length_mm,
+            "fret_count": self.fret_count,
+            "string_count": self.string_count,
+            "manufacturer": self.manufacturer,
+            "year_introduced": self.year_introduced,
+            "status": self.status,
+            "description": self.description,
+        }
+
+
+def _log(message: str) -> None:
+    """Report a warning on stderr, so it stays visible with --quiet."""
+    sys.stderr.write(message + "\n")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when available, else stdlib)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _intern(value: Any) -> Any:
+    """Intern low-cardinality string fields so repeated values share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _to_dict(obj: Any) -> Dict[str, Any]:
+    """Serializer hook: expand record types (e.g. InstrumentModel) into dicts."""
+    try:
+        return obj._asdict()
+    except AttributeError:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable") from None
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize to canonical JSON: sorted keys, 2-space indent, UTF-8."""
+    if orjson is not None:
+        # Route dataclasses through _to_dict so their keys are sorted too
+        return orjson.dumps(
+            data,
+            default=_to_dict,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SORT_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+    return json.dumps(
+        data, indent=2, ensure_ascii=False, sort_keys=True, default=_to_dict
+    ).encode("utf-8")
+
 
 def load_json(path: Path) -> Optional[Dict[str, Any]]:
     """Load JSON file, return None if not found."""
-    if not path.exists():
-        print(f"  WARN: File not found: {path}")
+    try:
+        return _loads(path.read_bytes())
+    except FileNotFoundError:
+        _log(f"  WARN: File not found: {path}")
         return None
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
 
 
 def extract_instruments(toolbox_path: Path) -> Dict[str, Any]:
@@ -62,26 +153,30 @@ def extract_instruments(toolbox_path: Path) -> Dict[str, Any]:
     if not data:
         return {"models": [], "source": str(registry_path), "error": "not_found"}
 
-    models = []
+    models: List[InstrumentModel] = []
+    categories: Dict[str, None] = {}  # Ordered set: first-seen order, stable hashes
     for model_id, info in data.get("models", {}).items():
-        models.append({
-            "id": model_id,
-            "display_name": info.get("display_name", model_id),
-            "category": info.get("category", "unknown"),
-            "scale_length_mm": info.get("scale_length_mm"),
-            "fret_count": info.get("fret_count"),
-            "string_count": info.get("string_count"),
-            "manufacturer": info.get("manufacturer"),
-            "year_introduced": info.get("year_introduced"),
-            "status": info.get("status", "STUB"),
-            "description": info.get("description", ""),
-        })
+        get = info.get  # Bound once per row; the row reads up to nine fields
+        category = _intern(get("category", "unknown"))
+        categories[category] = None
+        models.append(InstrumentModel(
+            id=model_id,
+            display_name=get("display_name", model_id),
+            category=category,
+            scale_length_mm=get("scale_length_mm"),
+            fret_count=get("fret_count"),
+            string_count=get("string_count"),
+            manufacturer=_intern(get("manufacturer")),
+            year_introduced=get("year_introduced"),
+            status=_intern(get("status", "STUB")),
+            description=get("description", ""),
+        ))
 
     return {
         "models": models,
         "count": len(models),
         "source": str(registry_path),
-        "categories": list(set(m["category"] for m in models)),
+        "categories": list(categories),
     }
 
 
@@ -95,14 +190,15 @@ def extract_body_outlines(toolbox_path: Path) -> Dict[str, Any]:
 
     bodies = []
     for body_id, info in data.get("bodies", {}).items():
+        get = info.get
         bodies.append({
             "id": body_id,
-            "name": info.get("name", body_id),
-            "category": info.get("category", "unknown"),
-            "dimensions_mm": info.get("dimensions_mm", {}),
-            "points": info.get("points", 0),
-            "dxf": info.get("dxf"),
-            "source": info.get("source", ""),
+            "name": get("name", body_id),
+            "category": _intern(get("category", "unknown")),
+            "dimensions_mm": get("dimensions_mm", {}),
+            "points": get("points", 0),
+            "dxf": get("dxf"),
+            "source": get("source", ""),
         })
 
     return {
@@ -121,36 +217,66 @@ def extract_rosette_patterns(toolbox_path: Path) -> Dict[str, Any]:
     if not data:
         return {"patterns": [], "source": str(catalog_path), "error": "not_found"}
 
-    patterns = []
-    for category, pattern_list in data.get("categories", {}).items():
-        for pattern in pattern_list:
-            patterns.append({
-                "id": pattern.get("id"),
-                "name": pattern.get("name"),
-                "category": category,
-                "rows": pattern.get("rows"),
-                "columns": pattern.get("columns"),
-                "materials": pattern.get("materials", []),
-                "dimensions": pattern.get("dimensions", {}),
-                "notes": pattern.get("notes", ""),
-            })
+    cats = data.get("categories", {})
+    patterns = [
+        {
+            "id": p.get("id"),
+            "name": p.get("name"),
+            "category": category,
+            "rows": p.get("rows"),
+            "columns": p.get("columns"),
+            "materials": p.get("materials", []),
+            "dimensions": p.get("dimensions", {}),
+            "notes": p.get("notes", ""),
+        }
+        for category, pattern_list in cats.items()
+        for p in pattern_list
+    ]
 
     return {
         "patterns": patterns,
         "count": len(patterns),
         "source": str(catalog_path),
-        "categories": list(data.get("categories", {}).keys()),
+        "categories": list(cats),
     }
 
 
+def _read_vocab_ast(tree: ast.Module, vocab: Dict[str, List[str]]) -> None:
+    """Fill vocab from top-level list literals (NAME: List[str] = [...] or NAME = [...])."""
+    wanted = {key.upper(): key for key in vocab}
+    for node in tree.body:
+        if isinstance(node, ast.AnnAssign):
+            targets, value = [node.target], node.value
+        elif isinstance(node, ast.Assign):
+            targets, value = node.targets, node.value
+        else:
+            continue
+        for target in targets:
+            if not (isinstance(target, ast.Name) and target.id.upper() in wanted):
+                continue
+            try:
+                items = ast.literal_eval(value) if value is not None else None
+            except ValueError:
+                continue  # Built from other names, not a plain literal
+            if isinstance(items, (list, tuple)):
+                vocab[wanted[target.id.upper()]] = [i for i in items if isinstance(i, str)]
+
+
 def extract_vocabulary(toolbox_path: Path) -> Dict[str, Any]:
     """Extract vision vocabulary."""
     vocab_path = toolbox_path / "services/api/app/vision/vocabulary.py"
 
-    if not vocab_path.exists():
+    try:
+        source = vocab_path.read_text(encoding="utf-8")
+        tree = ast.parse(source, filename=str(vocab_path))
+    except FileNotFoundError:
         return {"error": "not_found", "source": str(vocab_path)}
+    except SyntaxError as e:
+        # No text-scanning fallback: it would silently read different lists
+        _log(f"  WARN: Could not parse {vocab_path}: {e}")
+        return {"error": "syntax_error", "source": str(vocab_path)}
 
-    # Parse vocabulary from Python file
+    # Read the vocabulary lists from the parsed module
     vocab = {
         "body_shapes": [],
         "finishes": [],
@@ -159,20 +285,7 @@ def extract_vocabulary(toolbox_path: Path) -> Dict[str, Any]:
         "inlays": [],
         "photography_styles": [],
     }
-
-    with open(vocab_path, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    # Extract lists using simple parsing
-    import re
-    for key in vocab.keys():
-        # Match VARIABLE: List[str] = [...]
-        pattern = rf'{key.upper()}: List\[str\] = \[(.*?)\]'
-        match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-        if match:
-            items_str = match.group(1)
-            items = re.findall(r'"([^"]+)"', items_str)
-            vocab[key] = items
+    _read_vocab_ast(tree, vocab)
 
     return {
         "vocabulary": vocab,
@@ -181,36 +294,72 @@ def extract_vocabulary(toolbox_path: Path) -> Dict[str, Any]:
     }
 
 
-def create_knowledge_structure(output_dir: Path) -> None:
-    """Create knowledge base directory structure."""
-    dirs = [
+def create_knowledge_structure(output_dir: Path) -> Tuple[Path, Path, Path]:
+    """Create knowledge base directory structure.
+
+    Returns the (lutherie, styles, patterns) directories so callers can
+    build file paths from them.
+    """
+    dirs = (
         output_dir / "lutherie",
         output_dir / "styles",
         output_dir / "patterns",
-    ]
+    )
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # One listing of output_dir instead of a mkdir attempt per subdirectory;
+    # on re-seeds every subdirectory already exists
+    with os.scandir(output_dir) as entries:
+        existing = {entry.name for entry in entries if entry.is_dir()}
     for d in dirs:
-        d.mkdir(parents=True, exist_ok=True)
+        if d.name not in existing:
+            d.mkdir(exist_ok=True)
+    return dirs
 
 
 def write_json(path: Path, data: Dict[str, Any]) -> str:
-    """Write JSON file and return sha256."""
-    content = json.dumps(data, indent=2, ensure_ascii=False)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
-    return hashlib.sha256(content.encode()).hexdigest()[:16]
+    """Write JSON file and return sha256 of its content.
 
-
-def seed_knowledge_base(toolbox_path: Path, output_dir: Path) -> Dict[str, Any]:
+    The write is skipped when the file already holds identical bytes, so a
+    no-op re-seed leaves unchanged files (and their mtimes) untouched.
+    """
+    content = _dumps(data)
+    try:
+        unchanged = path.read_bytes() == content
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        # The payload is already one bytes object, so skip the buffered layer
+        # and hand it to the raw file directly, looping on short writes
+        with open(path, "wb", buffering=0) as f:
+            view = memoryview(content)
+            while view:
+                view = view[f.write(view):]
+    return hashlib.sha256(content, **_SHA256_KWARGS).hexdigest()[:16]
+
+
+def seed_knowledge_base(
+    toolbox_path: Path,
+    output_dir: Path,
+    quiet: bool = False,
+) -> Dict[str, Any]:
     """
     Main seeding function.
 
     Extracts data from luthiers-toolbox and writes to ai-integrator knowledge base.
+    Unless ``quiet`` is set, the header is written to stdout before extraction
+    and the remaining progress in one go at the end. Warnings go to stderr
+    either way.
     """
-    print(f"Seeding knowledge base from: {toolbox_path}")
-    print(f"Output directory: {output_dir}")
-    print()
+    if not quiet:
+        sys.stdout.write(
+            f"Seeding knowledge base from: {toolbox_path}\n"
+            f"Output directory: {output_dir}\n"
+            "\n"
+            "Extracting instrument models, body outlines, rosette patterns, vocabulary...\n"
+        )
+        sys.stdout.flush()  # Ahead of any stderr warnings, even when piped
 
-    create_knowledge_structure(output_dir)
+    lutherie_dir, styles_dir, patterns_dir = create_knowledge_structure(output_dir)
 
     manifest = {
         "seeded_at": datetime.now(timezone.utc).isoformat(),
@@ -218,99 +367,103 @@ def seed_knowledge_base(toolbox_path: Path, output_dir: Path) -> Dict[str, Any]:
         "files": {},
     }
 
-    # Extract instruments
-    print("Extracting instrument models...")
     instruments = extract_instruments(toolbox_path)
-    path = output_dir / "lutherie" / "instruments.json"
-    sha = write_json(path, instruments)
-    manifest["files"]["instruments"] = {"path": str(path), "sha256": sha, "count": instruments.get("count", 0)}
-    print(f"  -> {instruments.get('count', 0)} models written to {path.name}")
-
-    # Extract body outlines
-    print("Extracting body outlines...")
     bodies = extract_body_outlines(toolbox_path)
-    path = output_dir / "lutherie" / "body_outlines.json"
-    sha = write_json(path, bodies)
-    manifest["files"]["body_outlines"] = {"path": str(path), "sha256": sha, "count": bodies.get("count", 0)}
-    print(f"  -> {bodies.get('count', 0)} bodies written to {path.name}")
-
-    # Extract rosette patterns
-    print("Extracting rosette patterns...")
     rosettes = extract_rosette_patterns(toolbox_path)
-    path = output_dir / "patterns" / "rosettes.json"
-    sha = write_json(path, rosettes)
-    manifest["files"]["rosettes"] = {"path": str(path), "sha256": sha, "count": rosettes.get("count", 0)}
-    print(f"  -> {rosettes.get('count', 0)} patterns written to {path.name}")
-
-    # Extract vocabulary
-    print("Extracting vision vocabulary...")
     vocab = extract_vocabulary(toolbox_path)
 
+    # Look the vocabulary and its source up once for all four outputs
+    words = vocab.get("vocabulary") or {}
+    vocab_source = vocab.get("source")
+
     # Woods
     woods_data = {
-        "woods": vocab.get("vocabulary", {}).get("woods", []),
-        "source": vocab.get("source"),
+        "woods": words.get("woods", []),
+        "source": vocab_source,
         "description": "Tonewood types for guitar construction",
     }
-    path = output_dir / "lutherie" / "woods.json"
-    sha = write_json(path, woods_data)
-    manifest["files"]["woods"] = {"path": str(path), "sha256": sha, "count": len(woods_data["woods"])}
 
     # Components (hardware + inlays)
     components_data = {
-        "hardware": vocab.get("vocabulary", {}).get("hardware", []),
-        "inlays": vocab.get("vocabulary", {}).get("inlays", []),
-        "body_shapes": vocab.get("vocabulary", {}).get("body_shapes", []),
-        "source": vocab.get("source"),
+        "hardware": words.get("hardware", []),
+        "inlays": words.get("inlays", []),
+        "body_shapes": words.get("body_shapes", []),
+        "source": vocab_source,
     }
-    path = output_dir / "lutherie" / "components.json"
-    sha = write_json(path, components_data)
-    manifest["files"]["components"] = {"path": str(path), "sha256": sha}
 
     # Finishes
     finishes_data = {
-        "finishes": vocab.get("vocabulary", {}).get("finishes", []),
-        "source": vocab.get("source"),
+        "finishes": words.get("finishes", []),
+        "source": vocab_source,
     }
-    path = output_dir / "styles" / "finishes.json"
-    sha = write_json(path, finishes_data)
-    manifest["files"]["finishes"] = {"path": str(path), "sha256": sha, "count": len(finishes_data["finishes"])}
 
     # Photography styles
     photo_data = {
-        "photography_styles": vocab.get("vocabulary", {}).get("photography_styles", []),
-        "source": vocab.get("source"),
+        "photography_styles": words.get("photography_styles", []),
+        "source": vocab_source,
     }
-    path = output_dir / "styles" / "photography.json"
-    sha = write_json(path, photo_data)
-    manifest["files"]["photography"] = {"path": str(path), "sha256": sha, "count": len(photo_data["photography_styles"])}
 
-    print(f"  -> Vocabulary split into woods, components, finishes, photography")
+    # (manifest key, output path, data, count; None = no count recorded)
+    outputs = [
+        ("instruments", lutherie_dir / "instruments.json",
+         instruments, instruments.get("count", 0)),
+        ("body_outlines", lutherie_dir / "body_outlines.json",
+         bodies, bodies.get("count", 0)),
+        ("rosettes", patterns_dir / "rosettes.json",
+         rosettes, rosettes.get("count", 0)),
+        ("woods", lutherie_dir / "woods.json",
+         woods_data, len(woods_data["woods"])),
+        ("components", lutherie_dir / "components.json",
+         components_data, None),
+        ("finishes", styles_dir / "finishes.json",
+         finishes_data, len(finishes_data["finishes"])),
+        ("photography", styles_dir / "photography.json",
+         photo_data, len(photo_data["photography_styles"])),
+    ]
+    shas = [write_json(path, data) for _, path, data, _ in outputs]
+
+    counts: Dict[str, int] = {}
+    files = manifest["files"]
+    for (key, path, _, count), sha in zip(outputs, shas):
+        entry = files[key] = {"path": os.fspath(path), "sha256": sha}
+        if count is not None:
+            entry["count"] = counts[key] = count
+
+    log = [
+        f"  -> {counts['instruments']} models written to instruments.json",
+        f"  -> {counts['body_outlines']} bodies written to body_outlines.json",
+        f"  -> {counts['rosettes']} patterns written to rosettes.json",
+        "  -> Vocabulary split into woods, components, finishes, photography",
+    ]
 
     # Write manifest
-    print()
-    print("Writing manifest...")
+    log += ["", "Writing manifest..."]
     manifest_path = output_dir / "manifest.json"
     write_json(manifest_path, manifest)
-    print(f"  -> Manifest written to {manifest_path.name}")
+    log.append(f"  -> Manifest written to {manifest_path.name}")
 
     # Summary
-    print()
-    print("=" * 60)
-    print("KNOWLEDGE BASE SEEDING COMPLETE")
-    print("=" * 60)
-    print(f"  Instruments:  {manifest['files'].get('instruments', {}).get('count', 0)}")
-    print(f"  Body outlines: {manifest['files'].get('body_outlines', {}).get('count', 0)}")
-    print(f"  Rosettes:     {manifest['files'].get('rosettes', {}).get('count', 0)}")
-    print(f"  Woods:        {manifest['files'].get('woods', {}).get('count', 0)}")
-    print(f"  Finishes:     {manifest['files'].get('finishes', {}).get('count', 0)}")
-    print(f"  Photo styles: {manifest['files'].get('photography', {}).get('count', 0)}")
-    print()
+    log += [
+        "",
+        "=" * 60,
+        "KNOWLEDGE BASE SEEDING COMPLETE",
+        "=" * 60,
+        f"  Instruments:  {counts['instruments']}",
+        f"  Body outlines: {counts['body_outlines']}",
+        f"  Rosettes:     {counts['rosettes']}",
+        f"  Woods:        {counts['woods']}",
+        f"  Finishes:     {counts['finishes']}",
+        f"  Photo styles: {counts['photography']}",
+        "",
+    ]
+
+    if not quiet:
+        sys.stdout.write("\n".join(log) + "\n")
 
     return manifest
 
 
-def main():
+def main() -> int:
     parser = argparse.ArgumentParser(description="Seed ai-integrator knowledge base from luthiers-toolbox")
     parser.add_argument(
         "--toolbox-path",
@@ -324,6 +477,11 @@ def main():
         default=OUTPUT_DIR,
         help="Output directory for knowledge base",
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Suppress the progress summary (warnings are still reported)",
+    )
     args = parser.parse_args()
 
     if not args.toolbox_path.exists():
@@ -331,9 +489,9 @@ def main():
         print("Use --toolbox-path to specify the luthiers-toolbox location")
         return 1
 
-    seed_knowledge_base(args.toolbox_path, args.output_dir)
+    seed_knowledge_base(args.toolbox_path, args.output_dir, quiet=args.quiet)
     return 0
 
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(main())